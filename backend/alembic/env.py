@@ -1,35 +1,91 @@
 import os
 import json
-import boto3
+import functools
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy.engine import make_url
 
 from alembic import context
 
-# --- This code is now UPDATED ---
+
+@functools.lru_cache(maxsize=1)
+def _sm_client():
+    """Returns a cached Secrets Manager client."""
+    import boto3
+
+    return boto3.client("secretsmanager")
+
+
+_SECRET_CACHE: dict[str, dict] = {}
+
+
+def _matches_secret_id(secret_id: str, entry: dict) -> bool:
+    """Same rule as app.core.config._matches_secret_id (env.py can't import the app)."""
+    arn = entry.get("ARN") or ""
+    # Requested ids may be a full ARN, a partial ARN, or a name.
+    return secret_id in (arn, entry.get("Name")) or arn.startswith(f"{secret_id}-")
+
+
+def _fetch_secret_strings(secret_ids: list[str]) -> dict[str, str]:
+    try:
+        request = {"SecretIdList": secret_ids}
+        entries = []
+        while True:
+            response = _sm_client().batch_get_secret_value(**request)
+            errors = response.get("Errors") or []
+            if errors:
+                raise RuntimeError(f"Unable to fetch secrets: {errors}")
+            entries.extend(response.get("SecretValues", []))
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+            request["NextToken"] = next_token
+    except Exception as exc:
+        # Roles granted only secretsmanager:GetSecretValue cannot batch.
+        print(f"Batch secret fetch failed ({exc}); fetching secrets individually.")
+        return {
+            secret_id: _sm_client().get_secret_value(SecretId=secret_id)["SecretString"]
+            for secret_id in secret_ids
+        }
+
+    secret_strings = {}
+    for entry in entries:
+        for secret_id in secret_ids:
+            if _matches_secret_id(secret_id, entry):
+                secret_strings[secret_id] = entry["SecretString"]
+    return secret_strings
+
+
+def get_secrets(secret_arns: list[str]) -> dict[str, dict]:
+    """Fetches and decodes secrets in one batched call, caching per ARN."""
+    missing = [arn for arn in dict.fromkeys(secret_arns) if arn not in _SECRET_CACHE]
+    if missing:
+        for secret_id, secret_string in _fetch_secret_strings(missing).items():
+            _SECRET_CACHE[secret_id] = json.loads(secret_string)
+        unresolved = [arn for arn in missing if arn not in _SECRET_CACHE]
+        if unresolved:
+            raise RuntimeError(
+                f"Secrets Manager returned no value for: {', '.join(unresolved)}"
+            )
+    return {arn: _SECRET_CACHE[arn] for arn in secret_arns}
 
 
 def get_db_credentials():
     """Fetches database credentials from AWS Secrets Manager."""
     secret_arn = os.environ.get("DB_SECRET_ARN")
-    # --- THIS IS THE FIX ---
-    # Read the host and dbname from new, separate env vars
+    # Host and database name come from separate env vars, not the secret.
     db_host = os.environ.get("DB_HOST")
-    db_name = os.environ.get("DB_NAME", "aleenascuisine")  # Default
-    # --- END OF FIX ---
+    db_name = os.environ.get("DB_NAME", "aleenascuisine")
 
     if not secret_arn:
         raise ValueError("DB_SECRET_ARN environment variable not set.")
     if not db_host:
         raise ValueError("DB_HOST environment variable not set.")
 
-    client = boto3.client("secretsmanager")
-
     try:
-        response = client.get_secret_value(SecretId=secret_arn)
-        secret = json.loads(response["SecretString"])
+        secret = get_secrets([secret_arn])[secret_arn]
 
         # Return the combined credentials
         return {
@@ -43,9 +99,6 @@ def get_db_credentials():
         raise
 
 
-# --- End of update ---
-
-
 def get_database_url():
     """Returns the SQLAlchemy URL, respecting DATABASE_URL override."""
     override = os.environ.get("DATABASE_URL")
@@ -75,6 +128,10 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = None
 
+MIGRATION_LOCK_NAME = "alembic_migrate"
+MIGRATION_LOCK_TIMEOUT = int(os.environ.get("MIGRATION_LOCK_TIMEOUT", "30"))
+MIGRATION_CONNECT_TIMEOUT = 5
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
@@ -90,28 +147,72 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _run_with_connection(connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
 
+    # Callers running several commands programmatically can share one
+    # connection via ``Config.attributes`` instead of building an engine each time.
+    shared_connection = config.attributes.get("connection")
+    if shared_connection is not None:
+        _run_with_connection(shared_connection)
+        return
+
     db_url = get_database_url()
     connect_args = {}
+    if make_url(db_url).get_backend_name() == "mysql":
+        # Fail fast on an unreachable host instead of hanging on the socket.
+        connect_args["connect_timeout"] = MIGRATION_CONNECT_TIMEOUT
+
+    # Each run uses one fresh NullPool connection, so a pre-ping is pure overhead.
+    engine_options = config.get_section(config.config_ini_section, {})
+    engine_options.pop("sqlalchemy.pool_pre_ping", None)
 
     engine = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
+        engine_options,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
         url=db_url,
         connect_args=connect_args,
+        pool_pre_ping=False,
     )
 
     with engine.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-
-        with context.begin_transaction():
-            context.run_migrations()
-
-
-if context.is_offline_mode():
+        use_lock = connection.dialect.name == "mysql"
+        if use_lock:
+            # Named locks are session scoped, so commit the implicit
+            # transaction and let Alembic manage its own from a clean state.
+            acquired = connection.exec_driver_sql(
+                f"SELECT GET_LOCK('{MIGRATION_LOCK_NAME}', {MIGRATION_LOCK_TIMEOUT})"
+            ).scalar()
+            connection.commit()
+            if acquired != 1:
+                print("Another migration holds the lock; skipping this run.")
+                return
+
+        try:
+            _run_with_connection(connection)
+        finally:
+            if use_lock:
+                connection.exec_driver_sql(f"SELECT RELEASE_LOCK('{MIGRATION_LOCK_NAME}')")
+                connection.commit()
+
+
+# MIGRATION_MODE=skip lets containers that share this entrypoint boot without
+# touching the schema; "sync" (the default) runs migrations inline.
+migration_mode = os.environ.get("MIGRATION_MODE", "sync").strip().lower()
+if migration_mode not in {"sync", "skip"}:
+    raise ValueError(f"Unsupported MIGRATION_MODE: {migration_mode!r}")
+
+if migration_mode == "skip":
+    print("MIGRATION_MODE=skip; not running migrations.")
+elif context.is_offline_mode():
     run_migrations_offline()
 else:
     run_migrations_online()
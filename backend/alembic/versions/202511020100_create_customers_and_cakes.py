@@ -103,7 +103,5 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    op.drop_index("ix_cakes_category", table_name="cakes")
     op.drop_table("cakes")
-    op.drop_index("ix_customers_created_at", table_name="customers")
     op.drop_table("customers")
@@ -82,8 +82,5 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    op.drop_index("ix_carts_customer", table_name="carts")
-    op.drop_index("ix_cart_items_cake", table_name="cart_items")
-    op.drop_index("ix_cart_items_cart", table_name="cart_items")
     op.drop_table("cart_items")
     op.drop_table("carts")
@@ -25,18 +25,50 @@ ORDER_STATUSES = (
 )
 
 
-def _order_status_enum() -> sa.Enum:
-    return sa.Enum(
-        *ORDER_STATUSES,
-        name="order_status_enum",
-        native_enum=False,
-        create_constraint=True,
+_TABLE_OPTIONS = {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"}
+
+
+def _created_at() -> sa.Column:
+    return sa.Column(
+        "created_at",
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("CURRENT_TIMESTAMP"),
     )
 
 
-def upgrade() -> None:
-    status_enum = _order_status_enum()
+def _updated_at() -> sa.Column:
+    return sa.Column(
+        "updated_at",
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("CURRENT_TIMESTAMP"),
+        server_onupdate=sa.text("CURRENT_TIMESTAMP"),
+    )
+
+
+_ORDER_STATUS_ENUM = sa.Enum(
+    *ORDER_STATUSES,
+    name="order_status_enum",
+    native_enum=False,
+    create_constraint=True,
+)
+
+
+def _add_indexes(table_name: str, *indexes: tuple[str, list[str]]) -> None:
+    """Build a table's secondary indexes, in a single ALTER TABLE on MySQL."""
+    if op.get_context().dialect.name != "mysql":
+        for index_name, columns in indexes:
+            op.create_index(index_name, table_name, columns)
+        return
+
+    clauses = ", ".join(
+        f"ADD INDEX {index_name} ({', '.join(columns)})" for index_name, columns in indexes
+    )
+    op.execute(f"ALTER TABLE {table_name} {clauses}")
+
 
+def upgrade() -> None:
     op.create_table(
         "orders",
         sa.Column("order_id", sa.String(length=36), primary_key=True),
@@ -47,33 +79,20 @@ def upgrade() -> None:
             nullable=False,
         ),
         sa.Column("order_total", mysql.DECIMAL(precision=12, scale=2), nullable=False),
-        sa.Column("status", status_enum, nullable=False, server_default="pending"),
+        sa.Column("status", _ORDER_STATUS_ENUM, nullable=False, server_default="pending"),
         sa.Column("idempotency_key", sa.String(length=64), nullable=True),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            nullable=False,
-            server_default=sa.text("CURRENT_TIMESTAMP"),
-        ),
-        sa.Column(
-            "updated_at",
-            sa.DateTime(timezone=True),
-            nullable=False,
-            server_default=sa.text("CURRENT_TIMESTAMP"),
-            server_onupdate=sa.text("CURRENT_TIMESTAMP"),
-        ),
+        _created_at(),
+        _updated_at(),
         sa.CheckConstraint("order_total >= 0", name="ck_orders_total_non_negative"),
         sa.UniqueConstraint("idempotency_key", name="uq_orders_idempotency_key"),
-        mysql_charset="utf8mb4",
-        mysql_collate="utf8mb4_unicode_ci",
+        **_TABLE_OPTIONS,
     )
 
-    op.create_index(
-        "ix_orders_customer_created",
+    _add_indexes(
         "orders",
-        ["customer_id", "created_at"],
+        ("ix_orders_customer_created", ["customer_id", "created_at"]),
+        ("ix_orders_status", ["status"]),
     )
-    op.create_index("ix_orders_status", "orders", ["status"])
 
     op.create_table(
         "order_items",
@@ -92,27 +111,20 @@ def upgrade() -> None:
         ),
         sa.Column("quantity", sa.Integer(), nullable=False),
         sa.Column("price_each", mysql.DECIMAL(precision=10, scale=2), nullable=False),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            nullable=False,
-            server_default=sa.text("CURRENT_TIMESTAMP"),
-        ),
+        _created_at(),
         sa.CheckConstraint("quantity > 0", name="ck_order_items_quantity_positive"),
         sa.CheckConstraint("price_each >= 0", name="ck_order_items_price_non_negative"),
-        mysql_charset="utf8mb4",
-        mysql_collate="utf8mb4_unicode_ci",
+        **_TABLE_OPTIONS,
     )
 
-    op.create_index("ix_order_items_order", "order_items", ["order_id"])
-    op.create_index("ix_order_items_cake", "order_items", ["cake_id"])
+    _add_indexes(
+        "order_items",
+        ("ix_order_items_order", ["order_id"]),
+        ("ix_order_items_cake", ["cake_id"]),
+    )
 
 
 def downgrade() -> None:
-    op.drop_index("ix_order_items_cake", table_name="order_items")
-    op.drop_index("ix_order_items_order", table_name="order_items")
     op.drop_table("order_items")
-    op.drop_index("ix_orders_status", table_name="orders")
-    op.drop_index("ix_orders_customer_created", table_name="orders")
     op.drop_table("orders")
-    _order_status_enum().drop(op.get_bind(), checkfirst=False)
+    _ORDER_STATUS_ENUM.drop(op.get_bind(), checkfirst=False)
@@ -30,29 +30,57 @@ EVENT_STATUSES = (
 )
 
 
-def _payment_status_enum() -> sa.Enum:
-    return sa.Enum(
-        *PAYMENT_STATUSES,
-        name="payment_status_enum",
-        native_enum=False,
-        create_constraint=True,
+_TABLE_OPTIONS = {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"}
+
+
+def _created_at() -> sa.Column:
+    return sa.Column(
+        "created_at",
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("CURRENT_TIMESTAMP"),
     )
 
 
-def _event_status_enum() -> sa.Enum:
-    return sa.Enum(
-        *EVENT_STATUSES,
-        name="payment_event_status_enum",
-        native_enum=False,
-        create_constraint=True,
+def _updated_at() -> sa.Column:
+    return sa.Column(
+        "updated_at",
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("CURRENT_TIMESTAMP"),
+        server_onupdate=sa.text("CURRENT_TIMESTAMP"),
     )
 
 
-def upgrade() -> None:
-    payment_status_enum = _payment_status_enum()
+_PAYMENT_STATUS_ENUM = sa.Enum(
+    *PAYMENT_STATUSES,
+    name="payment_status_enum",
+    native_enum=False,
+    create_constraint=True,
+)
+
+_EVENT_STATUS_ENUM = sa.Enum(
+    *EVENT_STATUSES,
+    name="payment_event_status_enum",
+    native_enum=False,
+    create_constraint=True,
+)
+
+
+def _add_indexes(table_name: str, *indexes: tuple[str, list[str]]) -> None:
+    """Build a table's secondary indexes, in a single ALTER TABLE on MySQL."""
+    if op.get_context().dialect.name != "mysql":
+        for index_name, columns in indexes:
+            op.create_index(index_name, table_name, columns)
+        return
+
+    clauses = ", ".join(
+        f"ADD INDEX {index_name} ({', '.join(columns)})" for index_name, columns in indexes
+    )
+    op.execute(f"ALTER TABLE {table_name} {clauses}")
 
-    event_status_enum = _event_status_enum()
 
+def upgrade() -> None:
     op.create_table(
         "payments",
         sa.Column("payment_id", sa.String(length=36), primary_key=True),
@@ -67,33 +95,24 @@ def upgrade() -> None:
         sa.Column("provider_order_id", sa.String(length=100), nullable=False),
         sa.Column("provider_payment_id", sa.String(length=120), nullable=True),
         sa.Column(
-            "status", payment_status_enum, nullable=False, server_default="initiated"
+            "status", _PAYMENT_STATUS_ENUM, nullable=False, server_default="initiated"
         ),
         sa.Column("amount", mysql.DECIMAL(precision=12, scale=2), nullable=False),
         sa.Column(
             "currency", sa.String(length=3), nullable=False, server_default="INR"
         ),
         sa.Column("meta", sa.JSON(), nullable=True),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            nullable=False,
-            server_default=sa.text("CURRENT_TIMESTAMP"),
-        ),
-        sa.Column(
-            "updated_at",
-            sa.DateTime(timezone=True),
-            nullable=False,
-            server_default=sa.text("CURRENT_TIMESTAMP"),
-            server_onupdate=sa.text("CURRENT_TIMESTAMP"),
-        ),
+        _created_at(),
+        _updated_at(),
         sa.UniqueConstraint("provider_order_id", name="uq_payments_provider_order"),
-        mysql_charset="utf8mb4",
-        mysql_collate="utf8mb4_unicode_ci",
+        **_TABLE_OPTIONS,
     )
 
-    op.create_index("ix_payments_order", "payments", ["order_id"])
-    op.create_index("ix_payments_provider_payment", "payments", ["provider_payment_id"])
+    _add_indexes(
+        "payments",
+        ("ix_payments_order", ["order_id"]),
+        ("ix_payments_provider_payment", ["provider_payment_id"]),
+    )
 
     op.create_table(
         "payment_events",
@@ -107,7 +126,7 @@ def upgrade() -> None:
         sa.Column("provider", sa.String(length=50), nullable=False),
         sa.Column("event_type", sa.String(length=120), nullable=False),
         sa.Column(
-            "status", event_status_enum, nullable=False, server_default="pending"
+            "status", _EVENT_STATUS_ENUM, nullable=False, server_default="pending"
         ),
         sa.Column("headers", sa.JSON(), nullable=True),
         sa.Column("payload", sa.Text(), nullable=False),
@@ -118,12 +137,14 @@ def upgrade() -> None:
             server_default=sa.text("CURRENT_TIMESTAMP"),
         ),
         sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
-        mysql_charset="utf8mb4",
-        mysql_collate="utf8mb4_unicode_ci",
+        **_TABLE_OPTIONS,
     )
 
-    op.create_index("ix_payment_events_payment", "payment_events", ["payment_id"])
-    op.create_index("ix_payment_events_provider", "payment_events", ["provider"])
+    _add_indexes(
+        "payment_events",
+        ("ix_payment_events_payment", ["payment_id"]),
+        ("ix_payment_events_provider", ["provider"]),
+    )
 
     op.create_table(
         "webhook_logs",
@@ -134,15 +155,9 @@ def upgrade() -> None:
         sa.Column(
             "verified", sa.Boolean(), nullable=False, server_default=sa.text("0")
         ),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            nullable=False,
-            server_default=sa.text("CURRENT_TIMESTAMP"),
-        ),
+        _created_at(),
         sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
-        mysql_charset="utf8mb4",
-        mysql_collate="utf8mb4_unicode_ci",
+        **_TABLE_OPTIONS,
     )
 
     op.create_index("ix_webhook_logs_provider", "webhook_logs", ["provider"])
@@ -156,14 +171,8 @@ def upgrade() -> None:
         sa.Column("entity_id", sa.String(length=64), nullable=False),
         sa.Column("before", sa.JSON(), nullable=True),
         sa.Column("after", sa.JSON(), nullable=True),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            nullable=False,
-            server_default=sa.text("CURRENT_TIMESTAMP"),
-        ),
-        mysql_charset="utf8mb4",
-        mysql_collate="utf8mb4_unicode_ci",
+        _created_at(),
+        **_TABLE_OPTIONS,
     )
 
     op.create_index("ix_audit_log_entity", "audit_log", ["entity_type", "entity_id"])
@@ -178,31 +187,18 @@ def upgrade() -> None:
             nullable=False,
         ),
         sa.Column("s3_key", sa.String(length=512), nullable=False),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            nullable=False,
-            server_default=sa.text("CURRENT_TIMESTAMP"),
-        ),
-        mysql_charset="utf8mb4",
-        mysql_collate="utf8mb4_unicode_ci",
+        _created_at(),
+        **_TABLE_OPTIONS,
     )
 
     op.create_index("ix_invoices_order", "invoices", ["order_id"])
 
 
 def downgrade() -> None:
-    op.drop_index("ix_payments_order", table_name="payments")
-    op.drop_index("ix_invoices_order", table_name="invoices")
     op.drop_table("invoices")
-    op.drop_index("ix_audit_log_entity", table_name="audit_log")
     op.drop_table("audit_log")
-    op.drop_index("ix_webhook_logs_provider", table_name="webhook_logs")
     op.drop_table("webhook_logs")
-    op.drop_index("ix_payment_events_provider", table_name="payment_events")
-    op.drop_index("ix_payment_events_payment", table_name="payment_events")
     op.drop_table("payment_events")
-    op.drop_index("ix_payments_provider_payment", table_name="payments")
     op.drop_table("payments")
-    _payment_status_enum().drop(op.get_bind(), checkfirst=False)
-    _event_status_enum().drop(op.get_bind(), checkfirst=False)
+    _PAYMENT_STATUS_ENUM.drop(op.get_bind(), checkfirst=False)
+    _EVENT_STATUS_ENUM.drop(op.get_bind(), checkfirst=False)
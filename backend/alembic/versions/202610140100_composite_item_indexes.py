@@ -0,0 +1,33 @@
+"""Replace item single-column parent indexes with composite indexes.
+
+Revision ID: 202610140100
+Revises: 202511030700
+Create Date: 2026-10-14
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "202610140100"
+down_revision = "202511030700"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The composite indexes must exist before the single-column ones are
+    # dropped so the cart_id/order_id foreign keys always have an index.
+    op.create_index("ix_cart_items_cart_cake", "cart_items", ["cart_id", "cake_id"])
+    op.drop_index("ix_cart_items_cart", table_name="cart_items")
+
+    op.create_index("ix_order_items_order_cake", "order_items", ["order_id", "cake_id"])
+    op.drop_index("ix_order_items_order", table_name="order_items")
+
+
+def downgrade() -> None:
+    op.create_index("ix_order_items_order", "order_items", ["order_id"])
+    op.drop_index("ix_order_items_order_cake", table_name="order_items")
+
+    op.create_index("ix_cart_items_cart", "cart_items", ["cart_id"])
+    op.drop_index("ix_cart_items_cart_cake", table_name="cart_items")
@@ -0,0 +1,42 @@
+"""Store Razorpay identifiers as ascii_bin strings.
+
+Revision ID: 202610140110
+Revises: 202610140100
+Create Date: 2026-10-14
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "202610140110"
+down_revision = "202610140100"
+branch_labels = None
+depends_on = None
+
+# Razorpay ids (order_*, pay_*) are case-sensitive ASCII tokens, so a binary
+# ascii collation is both narrower and more accurate than utf8mb4_unicode_ci.
+_PROVIDER_ID_COLUMNS = {
+    "orders": ("provider_order_id", "provider_payment_id"),
+    "payments": ("provider_payment_id",),
+}
+
+
+def _modify_charset(charset: str, collation: str) -> None:
+    if op.get_context().dialect.name != "mysql":
+        return
+
+    for table_name, columns in _PROVIDER_ID_COLUMNS.items():
+        clauses = ", ".join(
+            f"MODIFY {column} VARCHAR(64) CHARACTER SET {charset} COLLATE {collation} NULL"
+            for column in columns
+        )
+        op.execute(f"ALTER TABLE {table_name} {clauses}")
+
+
+def upgrade() -> None:
+    _modify_charset("ascii", "ascii_bin")
+
+
+def downgrade() -> None:
+    _modify_charset("utf8mb4", "utf8mb4_unicode_ci")
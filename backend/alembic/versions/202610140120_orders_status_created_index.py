@@ -0,0 +1,25 @@
+"""Replace the orders status index with a (status, created_at) composite.
+
+Revision ID: 202610140120
+Revises: 202610140110
+Create Date: 2026-10-14
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "202610140120"
+down_revision = "202610140110"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_orders_status_created", "orders", ["status", "created_at"])
+    op.drop_index("ix_orders_status", table_name="orders")
+
+
+def downgrade() -> None:
+    op.create_index("ix_orders_status", "orders", ["status"])
+    op.drop_index("ix_orders_status_created", table_name="orders")
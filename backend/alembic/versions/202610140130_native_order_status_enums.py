@@ -0,0 +1,70 @@
+"""Store order and order payment statuses as native MySQL ENUMs.
+
+Revision ID: 202610140130
+Revises: 202610140120
+Create Date: 2026-10-14
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "202610140130"
+down_revision = "202610140120"
+branch_labels = None
+depends_on = None
+
+# Every value the order workflow writes (app/repositories/orders.py). Adding a
+# status in code requires a follow-up revision that extends these lists.
+ORDER_STATUSES = (
+    "created",
+    "pending",
+    "confirmed",
+    "processing",
+    "shipped",
+    "delivered",
+    "cancelled",
+    "refunded",
+    "payment_failed",
+    "expired",
+    "refund_initiated",
+)
+
+ORDER_PAYMENT_STATUSES = (
+    "pending",
+    "authorized",
+    "paid",
+    "failed",
+    "cancelled",
+    "refund_requested",
+    "refunded",
+)
+
+
+def _enum_sql(values: tuple[str, ...]) -> str:
+    return "ENUM(" + ", ".join(f"'{value}'" for value in values) + ")"
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "mysql":
+        return
+
+    # payments.status and refunds.status stay VARCHAR: they mirror free-form
+    # Razorpay states rather than a set the application controls.
+    op.execute(
+        "ALTER TABLE orders "
+        f"MODIFY status {_enum_sql(ORDER_STATUSES)} NOT NULL DEFAULT 'pending', "
+        f"MODIFY payment_status {_enum_sql(ORDER_PAYMENT_STATUSES)} "
+        "NOT NULL DEFAULT 'pending'"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "mysql":
+        return
+
+    op.execute(
+        "ALTER TABLE orders "
+        "MODIFY status VARCHAR(32) NOT NULL DEFAULT 'pending', "
+        "MODIFY payment_status VARCHAR(32) NOT NULL DEFAULT 'pending'"
+    )
@@ -0,0 +1,25 @@
+"""Index orders by Razorpay order id for webhook lookups.
+
+Revision ID: 202610140140
+Revises: 202610140130
+Create Date: 2026-10-14
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "202610140140"
+down_revision = "202610140130"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Webhooks without a known payment id fall back to matching
+    # orders.provider_order_id, which otherwise scans the table.
+    op.create_index("ix_orders_provider_order", "orders", ["provider_order_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_orders_provider_order", table_name="orders")
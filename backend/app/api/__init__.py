@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from .routes import admin, auth, cakes, cart, health, orders
 
-api_router = APIRouter()
-api_router.include_router(health.router)
-api_router.include_router(cakes.router)
-api_router.include_router(cart.router)
-api_router.include_router(orders.router)
-api_router.include_router(orders.payments_router)
-api_router.include_router(admin.router)
-api_router.include_router(auth.router)
+api_router = APIRouter(default_response_class=ORJSONResponse)
+for _router in (
+    health.router,
+    cakes.router,
+    cart.router,
+    orders.router,
+    orders.payments_router,
+    admin.router,
+    auth.router,
+):
+    api_router.include_router(_router)
 
 __all__ = ["api_router"]
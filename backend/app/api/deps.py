@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import Iterator
 
 from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.orm import Session
 
-from ..core.config import get_settings
-from ..db.session import get_db_session
-from ..repositories import orders as order_repo
+from ..core.config import SettingsScopedCache, get_settings
+from ..db.session import session_scope
 from ..schemas.common import ErrorResponse, RequestMetadata
 from ..services.auth import (
     CognitoJWTVerifier,
@@ -34,33 +32,40 @@ def request_metadata() -> RequestMetadata:
     return RequestMetadata(**build_request_metadata())
 
 
-_VERIFIER_CACHE: dict[tuple[str, bool, str | None], CognitoJWTVerifier] = {}
+def request_metadata_dict() -> dict[str, str]:
+    """Request metadata as a plain dict for handlers that return ORJSONResponse."""
+
+    return build_request_metadata()
+
+
+_VERIFIERS = SettingsScopedCache(CognitoJWTVerifier)
+
+# Static error payloads are built once; dynamic ones use plain dicts with the
+# same shape as ``ErrorResponse`` to skip model validation on failure paths.
+_MISSING_BEARER_DETAIL = ErrorResponse(
+    code="unauthorized",
+    message="Authorization header missing or invalid",
+    details=None,
+).model_dump()
+_RAZORPAY_NOT_CONFIGURED_DETAIL = ErrorResponse(
+    code="razorpay_not_configured",
+    message="Razorpay credentials are not configured",
+    details=None,
+).model_dump()
 
 
 def _bearer_token(header_value: str | None) -> str:
-    if not header_value or not header_value.startswith("Bearer "):
+    # The scheme is case-insensitive, matching the API Gateway authorizer.
+    if not header_value or header_value[:7].lower() != "bearer ":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=ErrorResponse(
-                code="unauthorized",
-                message="Authorization header missing or invalid",
-                details=None,
-            ).model_dump(),
+            detail=_MISSING_BEARER_DETAIL,
         )
-    return header_value.split(" ", 1)[1]
+    return header_value[7:].strip()
 
 
 def _get_verifier(settings) -> CognitoJWTVerifier:
-    cache_key = (
-        settings.cognito_user_pool_id or "test",
-        settings.cognito_test_mode,
-        settings.cognito_test_shared_secret,
-    )
-    verifier = _VERIFIER_CACHE.get(cache_key)
-    if verifier is None:
-        verifier = CognitoJWTVerifier(settings)
-        _VERIFIER_CACHE[cache_key] = verifier
-    return verifier
+    return _VERIFIERS.get(settings)
 
 
 def get_current_principal(
@@ -74,11 +79,11 @@ def get_current_principal(
     except JWTVerificationError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=ErrorResponse(
-                code="unauthorized",
-                message="Invalid bearer token",
-                details={"reason": str(exc)},
-            ).model_dump(),
+            detail={
+                "code": "unauthorized",
+                "message": "Invalid bearer token",
+                "details": {"reason": str(exc)},
+            },
         ) from exc
     return principal_from_claims(claims)
 
@@ -88,16 +93,15 @@ def require_admin(
     settings=Depends(get_settings),
 ) -> Principal:
     admin_group = settings.cognito_admin_group
-    principal_groups = {group.lower() for group in principal.groups}
-    if admin_group and admin_group.lower() not in principal_groups:
-        error = ErrorResponse(
-            code="admin_access_required",
-            message="Administrator privileges required",
-            details={"required_group": admin_group},
-        )
+    target = settings.cognito_admin_group_lower
+    if target and not any(group.lower() == target for group in principal.groups):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=error.model_dump(),
+            detail={
+                "code": "admin_access_required",
+                "message": "Administrator privileges required",
+                "details": {"required_group": admin_group},
+            },
         )
     return principal
 
@@ -106,68 +110,65 @@ def db_session(settings=Depends(get_settings)) -> Iterator[Session]:
     """Provide a transactional database session."""
 
     database_url = settings.database_url or "sqlite:///./aleena_dev.db"
-    session_iter = get_db_session(database_url)
-    session = next(session_iter)
-    try:
-        if settings.order_reservation_ttl_minutes > 0:
-            order_repo.expire_stale_reservations(session)
+    with session_scope(database_url) as session:
         yield session
-    finally:
-        try:
-            next(session_iter)
-        except StopIteration:
-            pass
 
 
-@lru_cache(maxsize=1)
-def _cached_razorpay_service(
-    key_id: str, key_secret: str, webhook_secret: str | None
-) -> RazorpayService:
+def _build_razorpay_service(settings) -> RazorpayService:
     return RazorpayService(
-        key_id=key_id,
-        key_secret=key_secret,
-        webhook_secret=webhook_secret,
+        key_id=settings.razorpay_key_id,
+        key_secret=settings.razorpay_key_secret,
+        webhook_secret=settings.razorpay_webhook_secret,
     )
 
 
+_RAZORPAY_SERVICES = SettingsScopedCache(_build_razorpay_service)
+
+
+def _cached_razorpay_service(settings) -> RazorpayService:
+    return _RAZORPAY_SERVICES.get(settings)
+
+
 def razorpay_service(settings=Depends(get_settings)) -> RazorpayService:
     """Return a Razorpay service instance configured from environment settings."""
 
     key_id = settings.razorpay_key_id
     key_secret = settings.razorpay_key_secret
     if not key_id or not key_secret:
-        error = ErrorResponse(
-            code="razorpay_not_configured",
-            message="Razorpay credentials are not configured",
-            details=None,
-        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error.model_dump(),
+            detail=_RAZORPAY_NOT_CONFIGURED_DETAIL,
         )
     try:
-        return _cached_razorpay_service(
-            key_id, key_secret, settings.razorpay_webhook_secret
-        )
+        return _cached_razorpay_service(settings)
     except RazorpayConfigurationError as exc:  # pragma: no cover - defensive
-        error = ErrorResponse(
-            code="razorpay_setup_failed",
-            message="Unable to initialize Razorpay client",
-            details={"error": str(exc)},
-        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error.model_dump(),
+            detail={
+                "code": "razorpay_setup_failed",
+                "message": "Unable to initialize Razorpay client",
+                "details": {"error": str(exc)},
+            },
         ) from exc
 
 
+def _build_sqs_dispatcher(settings) -> SQSNotificationDispatcher:
+    return SQSNotificationDispatcher(settings.post_payment_queue_url)
+
+
+# Keyed on the queue URL so the SQS client survives get_settings() rebuilds.
+_SQS_DISPATCHERS = SettingsScopedCache(
+    _build_sqs_dispatcher, key=lambda settings: settings.post_payment_queue_url
+)
+
+
 def notification_dispatcher() -> NotificationDispatcher:
     """Provide a notification dispatcher for post-payment workflows."""
 
     settings = get_settings()
     if settings.post_payment_queue_url:
         try:
-            return SQSNotificationDispatcher(settings.post_payment_queue_url)
+            return _SQS_DISPATCHERS.get(settings)
         except Exception:  # pragma: no cover - boto client errors
             return LoggingNotificationDispatcher()
     return LoggingNotificationDispatcher()
@@ -181,9 +182,9 @@ def invoice_service(settings=Depends(get_settings)) -> InvoiceService:
     except InvoiceGenerationError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=ErrorResponse(
-                code="invoice_generation_unavailable",
-                message="Invoice generation service is not configured",
-                details={"reason": str(exc)},
-            ).model_dump(),
+            detail={
+                "code": "invoice_generation_unavailable",
+                "message": "Invoice generation service is not configured",
+                "details": {"reason": str(exc)},
+            },
         ) from exc
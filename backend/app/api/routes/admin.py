@@ -5,9 +5,10 @@ from __future__ import annotations
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
-from ...api.deps import db_session, request_metadata, require_admin
+from ...api.deps import db_session, request_metadata_dict, require_admin
 from ...db.models import Cake
 from ...repositories import cakes as cake_repo
 from ...repositories import orders as order_repo
@@ -19,81 +20,77 @@ from ...schemas.admin import (
     InventoryAdjustmentRequest,
     OrderStatusUpdateRequest,
 )
-from ...schemas.cakes import CakeDetail, CakeDetailResponse
-from ...schemas.orders import OrderDetail, OrderDetailResponse
-from ...schemas.common import ErrorResponse, RequestMetadata
+from ...schemas.cakes import CakeDetailResponse
+from ...schemas.orders import OrderDetailResponse
 
 router = APIRouter(
     prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)]
 )
 
 
-def _serialize_cake_response(
-    cake: Cake, request: RequestMetadata
-) -> CakeDetailResponse:
-    detail = CakeDetail(**cake.to_dict())
-    return CakeDetailResponse(cake=detail, request=request)
+def _serialize_cake_response(cake: Cake, request: dict[str, str]) -> ORJSONResponse:
+    return ORJSONResponse({"cake": cake.to_dict(), "request": request})
 
 
 def _not_found(cake_id: str) -> HTTPException:
-    error = ErrorResponse(
-        code="cake_not_found",
-        message="Cake not found",
-        details={"cake_id": cake_id},
-    )
     return HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND, detail=error.model_dump()
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "code": "cake_not_found",
+            "message": "Cake not found",
+            "details": {"cake_id": cake_id},
+        },
     )
 
 
 def _inventory_error(cake_id: str) -> HTTPException:
-    error = ErrorResponse(
-        code="inventory_adjustment_invalid",
-        message="Inventory adjustment would result in negative stock",
-        details={"cake_id": cake_id},
-    )
     return HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST, detail=error.model_dump()
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "code": "inventory_adjustment_invalid",
+            "message": "Inventory adjustment would result in negative stock",
+            "details": {"cake_id": cake_id},
+        },
     )
 
 
 def _duplicate_slug(slug: str) -> HTTPException:
-    error = ErrorResponse(
-        code="cake_slug_conflict",
-        message="A cake with this slug already exists",
-        details={"slug": slug},
-    )
     return HTTPException(
-        status_code=status.HTTP_409_CONFLICT, detail=error.model_dump()
+        status_code=status.HTTP_409_CONFLICT,
+        detail={
+            "code": "cake_slug_conflict",
+            "message": "A cake with this slug already exists",
+            "details": {"slug": slug},
+        },
     )
 
 
 def _order_not_found(order_id: str) -> HTTPException:
-    error = ErrorResponse(
-        code="order_not_found",
-        message="Order not found",
-        details={"order_id": order_id},
-    )
     return HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND, detail=error.model_dump()
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "code": "order_not_found",
+            "message": "Order not found",
+            "details": {"order_id": order_id},
+        },
     )
 
 
-def _invalid_status_transition(order_id: str, status: str) -> HTTPException:
-    error = ErrorResponse(
-        code="invalid_status_transition",
-        message="Order status update is not permitted",
-        details={"order_id": order_id, "target_status": status},
-    )
+def _invalid_status_transition(order_id: str, target_status: str) -> HTTPException:
     return HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST, detail=error.model_dump()
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "code": "invalid_status_transition",
+            "message": "Order status update is not permitted",
+            "details": {"order_id": order_id, "target_status": target_status},
+        },
     )
 
 
 @router.post("/cakes", response_model=CakeDetailResponse, summary="Create a new cake")
 def create_cake(
     payload: CakeCreateRequest,
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
 ) -> Any:
     try:
@@ -118,7 +115,7 @@ def create_cake(
 def update_cake(
     cake_id: str,
     payload: CakeUpdateRequest,
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
 ) -> Any:
     try:
@@ -145,7 +142,7 @@ def update_cake(
 def update_cake_availability(
     cake_id: str,
     payload: CakeAvailabilityRequest,
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
 ) -> Any:
     try:
@@ -159,7 +156,7 @@ def update_cake_availability(
 def adjust_inventory(
     cake_id: str,
     payload: InventoryAdjustmentRequest,
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
 ) -> Any:
     try:
@@ -174,34 +171,34 @@ def adjust_inventory(
 @router.post("/cakes/{cake_id}/publish", response_model=AdminActionResponse)
 def publish_cake(
     cake_id: str,
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
 ) -> Any:
     try:
         cake_repo.set_availability(session, cake_id, True)
     except cake_repo.CakeNotFoundError as exc:
         raise _not_found(cake_id) from exc
-    return AdminActionResponse(success=True, request=request)
+    return ORJSONResponse({"success": True, "request": request})
 
 
 @router.post("/cakes/{cake_id}/unpublish", response_model=AdminActionResponse)
 def unpublish_cake(
     cake_id: str,
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
 ) -> Any:
     try:
         cake_repo.set_availability(session, cake_id, False)
     except cake_repo.CakeNotFoundError as exc:
         raise _not_found(cake_id) from exc
-    return AdminActionResponse(success=True, request=request)
+    return ORJSONResponse({"success": True, "request": request})
 
 
 @router.post("/orders/{order_id}/status", response_model=OrderDetailResponse)
 def update_order_status(
     order_id: str,
     payload: OrderStatusUpdateRequest,
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
 ) -> Any:
     try:
@@ -210,5 +207,5 @@ def update_order_status(
         raise _order_not_found(order_id) from exc
     except order_repo.OrderStatusUpdateError as exc:
         raise _invalid_status_transition(order_id, payload.status) from exc
-    detail = OrderDetail(**order_repo.serialize_order_detail(order))
-    return OrderDetailResponse(order=detail, request=request)
+    detail = order_repo.serialize_order_detail(order)
+    return ORJSONResponse({"order": detail, "request": request})
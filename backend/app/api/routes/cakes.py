@@ -5,20 +5,18 @@ from __future__ import annotations
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
-from ...api.deps import db_session, request_metadata
+from ...api.deps import db_session, request_metadata_dict
 from ...repositories import cakes as cake_repo
-from ...schemas.cakes import (
-    CakeDetail,
-    CakeDetailResponse,
-    CakeSummary,
-    PaginatedCakesResponse,
-)
-from ...schemas.common import ErrorResponse, RequestMetadata
+from ...schemas.cakes import CakeDetailResponse, PaginatedCakesResponse
 
 router = APIRouter(prefix="/cakes", tags=["cakes"])
 
+# Read endpoints return ORJSONResponse built from the repository dicts, which
+# FastAPI sends as-is; response_model is kept for the OpenAPI schema only.
+
 
 @router.get("", response_model=PaginatedCakesResponse)
 def list_cakes(
@@ -28,10 +26,10 @@ def list_cakes(
     max_price: float | None = Query(None, ge=0),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
 ) -> Any:
-    cakes, total = cake_repo.list_cakes(
+    summaries, total = cake_repo.list_cake_summaries(
         session,
         search=search,
         category=category,
@@ -40,27 +38,33 @@ def list_cakes(
         page=page,
         page_size=page_size,
     )
-    summaries = [CakeSummary(**cake_repo.to_summary_dict(cake)) for cake in cakes]
-    return PaginatedCakesResponse(cakes=summaries, total_count=total, request=request)
+    return ORJSONResponse(
+        {
+            "cakes": summaries,
+            "total_count": total,
+            "request": request,
+        }
+    )
 
 
 @router.get("/{cake_id}", response_model=CakeDetailResponse)
 def get_cake(
     cake_id: str,
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
 ) -> Any:
     try:
         cake = cake_repo.get_cake(session, cake_id)
     except cake_repo.CakeNotFoundError as exc:
-        error = ErrorResponse(
-            code="cake_not_found",
-            message="Cake not found",
-            details={"cake_id": cake_id},
-        )
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=error.model_dump()
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "code": "cake_not_found",
+                "message": "Cake not found",
+                "details": {"cake_id": cake_id},
+            },
         ) from exc
 
-    detail = CakeDetail(**cake_repo.to_detail_dict(cake))
-    return CakeDetailResponse(cake=detail, request=request)
+    return ORJSONResponse(
+        {"cake": cake_repo.to_detail_dict(cake), "request": request}
+    )
@@ -2,20 +2,19 @@
 
 from __future__ import annotations
 
-import uuid
 from typing import Dict
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import text
-from sqlalchemy.orm import Session
 
-from ..deps import db_session
+from ...core.config import get_settings
+from ...core.logging import new_request_id
+from ...db.session import get_engine
 
 router = APIRouter(tags=["health"], prefix="")
 
 
 @router.get("/health", summary="Service health check")
-def health_check(session: Session = Depends(db_session)) -> Dict[str, str]:
+def health_check(settings=Depends(get_settings)) -> Dict[str, str]:
     """Return a basic health indicator.
 
     The endpoint intentionally avoids heavy dependencies. Future iterations can
@@ -23,7 +22,11 @@ def health_check(session: Session = Depends(db_session)) -> Dict[str, str]:
     """
     db_status = "ok"
     try:
-        session.execute(text("SELECT 1"))
+        # Ping on a pooled connection directly; a liveness probe needs no ORM
+        # session or transaction bookkeeping.
+        engine = get_engine(settings.database_url or "sqlite:///./aleena_dev.db")
+        with engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1")
     except Exception:  # pragma: no cover - health endpoint resilience
         db_status = "error"
 
@@ -31,5 +34,5 @@ def health_check(session: Session = Depends(db_session)) -> Dict[str, str]:
     return {
         "status": overall,
         "database": db_status,
-        "request_id": str(uuid.uuid4()),
+        "request_id": new_request_id(),
     }
@@ -6,29 +6,29 @@ import logging
 import time
 from typing import Any, Sequence, Union
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from ...api.deps import (
     db_session,
     notification_dispatcher,
     razorpay_service,
-    request_metadata,
+    request_metadata_dict,
     require_admin,
 )
-from ...core.config import get_settings
+from ...core.config import SettingsScopedCache, get_settings
 from ...core.metrics import emit_metric
 from ...core.tracing import add_tracing_metadata, xray_subsegment
 from ...repositories import cart as cart_repo
 from ...repositories import orders as order_repo
-from ...schemas.common import ErrorResponse, RequestMetadata
 from ...schemas.orders import (
     OrderCancelResponse,
     OrderCreateRequest,
     OrderCreateResponse,
-    OrderDetail,
     OrderDetailResponse,
-    OrderSummary,
     OrdersListResponse,
     RazorpayWebhookResponse,
     RefundRequest,
@@ -42,103 +42,109 @@ router = APIRouter(prefix="/orders", tags=["orders"])
 
 logger = logging.getLogger(__name__)
 
+_PRICING_RULES = SettingsScopedCache(cart_repo.PricingRules.from_settings)
+
+
+def _pricing_rules(settings) -> cart_repo.PricingRules:
+    return _PRICING_RULES.get(settings)
+
 
 def _order_not_found(order_id: str) -> HTTPException:
-    error = ErrorResponse(
-        code="order_not_found",
-        message="Order not found",
-        details={"order_id": order_id},
-    )
     return HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND, detail=error.model_dump()
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "code": "order_not_found",
+            "message": "Order not found",
+            "details": {"order_id": order_id},
+        },
     )
 
 
 def _cart_missing(reference: str | None) -> HTTPException:
-    error = ErrorResponse(
-        code="cart_missing",
-        message="A valid cart is required to create an order",
-        details={"cart_reference": reference},
-    )
     return HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST, detail=error.model_dump()
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "code": "cart_missing",
+            "message": "A valid cart is required to create an order",
+            "details": {"cart_reference": reference},
+        },
     )
 
 
 def _payment_missing(payment_id: str) -> HTTPException:
-    error = ErrorResponse(
-        code="payment_not_found",
-        message="Payment not found",
-        details={"payment_id": payment_id},
-    )
     return HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND, detail=error.model_dump()
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "code": "payment_not_found",
+            "message": "Payment not found",
+            "details": {"payment_id": payment_id},
+        },
     )
 
 
 def _cart_empty(cart_id: str) -> HTTPException:
-    error = ErrorResponse(
-        code="cart_empty",
-        message="Cart contains no items",
-        details={"cart_id": cart_id},
-    )
     return HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST, detail=error.model_dump()
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "code": "cart_empty",
+            "message": "Cart contains no items",
+            "details": {"cart_id": cart_id},
+        },
     )
 
 
 def _inventory_unavailable(cake_id: str) -> HTTPException:
-    error = ErrorResponse(
-        code="inventory_unavailable",
-        message="Requested quantity exceeds available stock",
-        details={"cake_id": cake_id},
-    )
     return HTTPException(
-        status_code=status.HTTP_409_CONFLICT, detail=error.model_dump()
+        status_code=status.HTTP_409_CONFLICT,
+        detail={
+            "code": "inventory_unavailable",
+            "message": "Requested quantity exceeds available stock",
+            "details": {"cake_id": cake_id},
+        },
     )
 
 
 def _cancellation_not_allowed(order_id: str) -> HTTPException:
-    error = ErrorResponse(
-        code="cancellation_not_allowed",
-        message="Order can no longer be cancelled",
-        details={"order_id": order_id},
-    )
     return HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST, detail=error.model_dump()
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "code": "cancellation_not_allowed",
+            "message": "Order can no longer be cancelled",
+            "details": {"order_id": order_id},
+        },
     )
 
 
 def _razorpay_failure(reason: str) -> HTTPException:
-    error = ErrorResponse(
-        code="razorpay_unavailable",
-        message="Failed to integrate with Razorpay",
-        details={"reason": reason},
-    )
     return HTTPException(
-        status_code=status.HTTP_502_BAD_GATEWAY, detail=error.model_dump()
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail={
+            "code": "razorpay_unavailable",
+            "message": "Failed to integrate with Razorpay",
+            "details": {"reason": reason},
+        },
     )
 
 
 def _invalid_webhook_signature() -> HTTPException:
-    error = ErrorResponse(
-        code="invalid_signature",
-        message="Webhook signature verification failed",
-        details=None,
-    )
     return HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST, detail=error.model_dump()
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "code": "invalid_signature",
+            "message": "Webhook signature verification failed",
+            "details": None,
+        },
     )
 
 
 def _invalid_webhook_payload(reason: str) -> HTTPException:
-    error = ErrorResponse(
-        code="invalid_webhook_payload",
-        message="Unable to parse Razorpay webhook payload",
-        details={"reason": reason},
-    )
     return HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST, detail=error.model_dump()
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "code": "invalid_webhook_payload",
+            "message": "Unable to parse Razorpay webhook payload",
+            "details": {"reason": reason},
+        },
     )
 
 
@@ -147,32 +153,31 @@ def _cart_price_mismatch(
     mismatches: Sequence[tuple[str, float, float]],
     tolerance: float,
 ) -> HTTPException:
-    error = ErrorResponse(
-        code="cart_price_mismatch",
-        message="Cart pricing is outdated; refresh the cart before ordering",
-        details={
-            "cart_id": cart_id,
-            "tolerance": tolerance,
-            "items": [
-                {
-                    "cake_id": cake_id,
-                    "catalog_price": expected,
-                    "cart_price": actual,
-                }
-                for cake_id, expected, actual in mismatches
-            ],
-        },
-    )
     return HTTPException(
         status_code=status.HTTP_409_CONFLICT,
-        detail=error.model_dump(),
+        detail={
+            "code": "cart_price_mismatch",
+            "message": "Cart pricing is outdated; refresh the cart before ordering",
+            "details": {
+                "cart_id": cart_id,
+                "tolerance": tolerance,
+                "items": [
+                    {
+                        "cake_id": cake_id,
+                        "catalog_price": expected,
+                        "cart_price": actual,
+                    }
+                    for cake_id, expected, actual in mismatches
+                ],
+            },
+        },
     )
 
 
 @router.post("", response_model=OrderCreateResponse)
 def create_order(
     payload: OrderCreateRequest,
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
     settings=Depends(get_settings),
     razorpay=Depends(razorpay_service),
@@ -203,7 +208,7 @@ def create_order(
                 is_test=payload.is_test
                 if payload.is_test is not None
                 else settings.is_test_mode,
-                pricing=cart_repo.PricingRules.from_settings(settings),
+                pricing=_pricing_rules(settings),
                 price_match_tolerance=settings.price_match_tolerance,
                 reservation_ttl_minutes=settings.order_reservation_ttl_minutes,
             )
@@ -241,7 +246,7 @@ def create_order(
         with xray_subsegment("db.set_provider_reference"):
             order_repo.set_provider_order_reference(session, order, provider_order_id)
 
-    detail = OrderDetail(**order_repo.serialize_order_detail(order))
+    detail = order_repo.serialize_order_detail(order)
     add_tracing_metadata(order_id=order.order_id, provider_order_id=provider_order_id)
     duration_ms = round((time.perf_counter() - start_time) * 1000, 3)
     emit_metric(
@@ -256,10 +261,12 @@ def create_order(
             1,
             dimensions={"Environment": settings.aleena_env},
         )
-    return OrderCreateResponse(
-        order=detail,
-        provider_order_id=provider_order_id or "",
-        request=request,
+    return ORJSONResponse(
+        {
+            "order": detail,
+            "provider_order_id": provider_order_id or "",
+            "request": request,
+        }
     )
 
 
@@ -269,27 +276,24 @@ def create_order(
 )
 def get_order_or_orders(
     identifier: str,
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
-) -> Union[OrderDetailResponse, OrdersListResponse]:
+) -> Any:
     try:
         order = order_repo.get_order(session, identifier)
     except order_repo.OrderNotFoundError:
         orders = order_repo.list_orders(session, identifier)
-        summaries = [
-            OrderSummary(**order_repo.serialize_order_summary(order))
-            for order in orders
-        ]
-        return OrdersListResponse(orders=summaries, request=request)
+        summaries = [order_repo.serialize_order_summary(order) for order in orders]
+        return ORJSONResponse({"orders": summaries, "request": request})
 
-    detail = OrderDetail(**order_repo.serialize_order_detail(order))
-    return OrderDetailResponse(order=detail, request=request)
+    detail = order_repo.serialize_order_detail(order)
+    return ORJSONResponse({"order": detail, "request": request})
 
 
 @router.post("/{order_id}/cancel", response_model=OrderCancelResponse)
 def cancel_order(
     order_id: str,
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
 ) -> Any:
     try:
@@ -298,71 +302,38 @@ def cancel_order(
         raise _order_not_found(order_id) from exc
     except order_repo.OrderCancellationNotAllowedError as exc:
         raise _cancellation_not_allowed(order_id) from exc
-    detail = OrderDetail(**order_repo.serialize_order_detail(order))
-    return OrderCancelResponse(order=detail, request=request)
+    detail = order_repo.serialize_order_detail(order)
+    return ORJSONResponse({"order": detail, "request": request})
 
 
 payments_router = APIRouter(prefix="/payments", tags=["payments"])
 
+# Only these headers are stored with each Razorpay event; the rest are proxy
+# and gateway noise.
+_PERSISTED_WEBHOOK_HEADERS = (
+    "content-type",
+    "x-razorpay-event-id",
+    "x-razorpay-signature",
+)
 
-@payments_router.post("/webhook/razorpay", response_model=RazorpayWebhookResponse)
-async def razorpay_webhook(
-    http_request: Request,
-    session: Session = Depends(db_session),
-    metadata: RequestMetadata = Depends(request_metadata),
-    razorpay=Depends(razorpay_service),
-    dispatcher: NotificationDispatcher = Depends(notification_dispatcher),
-    settings=Depends(get_settings),
-) -> Any:
-    raw_body = await http_request.body()
-    # FastAPI normalizes header lookups to be case-insensitive, so always use lowercase here.
-    signature = http_request.headers.get("x-razorpay-signature")
-    headers = {key: value for key, value in http_request.headers.items()}
-
-    try:
-        body_preview = raw_body.decode("utf-8")
-    except Exception:  # pragma: no cover - defensive guard for invalid encoding
-        body_preview = raw_body[:256].decode("utf-8", errors="replace")
-    logger.warning(
-        "razorpay_webhook_received",
-        extra={
-            "signature_header": signature or "",
-            "body_length": len(raw_body),
-        },
-    )
-    print(
-        "WEBHOOK_DEBUG signature=%s length=%s body=%s"
-        % (signature or "", len(raw_body), body_preview[:512])
-    )
-
-    try:
-        with xray_subsegment("external.razorpay.verify_webhook"):
-            razorpay.verify_webhook_signature(raw_body, signature)
-    except RazorpayWebhookVerificationError as exc:
-        emit_metric(
-            "webhook_failures",
-            dimensions={
-                "Environment": settings.aleena_env,
-                "reason": "invalid_signature",
-            },
-        )
-        raise _invalid_webhook_signature() from exc
-
-    try:
-        payload = await http_request.json()
-    except Exception as exc:  # pragma: no cover - invalid JSON
-        emit_metric(
-            "webhook_failures",
-            dimensions={"Environment": settings.aleena_env, "reason": "invalid_json"},
-        )
-        raise _invalid_webhook_payload(str(exc)) from exc
 
+def _process_webhook_event(
+    session: Session,
+    payload: dict[str, Any],
+    *,
+    raw_body: bytes,
+    headers: dict[str, str],
+    signature: str,
+    metadata: dict[str, str],
+    dispatcher: NotificationDispatcher,
+    settings: Any,
+) -> ORJSONResponse:
     with xray_subsegment("db.record_webhook"):
         order_repo.record_webhook(
             session,
             headers=headers,
-            payload=payload,
-            signature=signature or "",
+            raw_payload=raw_body,
+            signature=signature,
         )
 
     with xray_subsegment("db.apply_payment_event", event=payload.get("event")):
@@ -375,7 +346,7 @@ async def razorpay_webhook(
                 "reason": "payment_not_found",
             },
         )
-        return RazorpayWebhookResponse(accepted=True, request=metadata)
+        return ORJSONResponse({"accepted": True, "request": metadata})
     if (
         order
         and payment
@@ -405,7 +376,71 @@ async def razorpay_webhook(
         dispatcher.send_payment_status_update(order, "order.payment_failed")
         add_tracing_metadata(payment_status=payment.status)
 
-    return RazorpayWebhookResponse(accepted=True, request=metadata)
+    return ORJSONResponse({"accepted": True, "request": metadata})
+
+
+@payments_router.post("/webhook/razorpay", response_model=RazorpayWebhookResponse)
+async def razorpay_webhook(
+    http_request: Request,
+    session: Session = Depends(db_session),
+    metadata: dict[str, str] = Depends(request_metadata_dict),
+    razorpay=Depends(razorpay_service),
+    dispatcher: NotificationDispatcher = Depends(notification_dispatcher),
+    settings=Depends(get_settings),
+) -> Any:
+    raw_body = await http_request.body()
+    # FastAPI normalizes header lookups to be case-insensitive, so always use lowercase here.
+    signature = http_request.headers.get("x-razorpay-signature")
+    request_headers = http_request.headers
+    headers = {
+        name: request_headers[name]
+        for name in _PERSISTED_WEBHOOK_HEADERS
+        if name in request_headers
+    }
+
+    logger.warning(
+        "razorpay_webhook_received",
+        extra={
+            "signature_header": signature or "",
+            "body_length": len(raw_body),
+        },
+    )
+
+    try:
+        with xray_subsegment("external.razorpay.verify_webhook"):
+            razorpay.verify_webhook_signature(raw_body, signature)
+    except RazorpayWebhookVerificationError as exc:
+        emit_metric(
+            "webhook_failures",
+            dimensions={
+                "Environment": settings.aleena_env,
+                "reason": "invalid_signature",
+            },
+        )
+        raise _invalid_webhook_signature() from exc
+
+    try:
+        payload = orjson.loads(raw_body)
+    except orjson.JSONDecodeError as exc:  # pragma: no cover - invalid JSON
+        emit_metric(
+            "webhook_failures",
+            dimensions={"Environment": settings.aleena_env, "reason": "invalid_json"},
+        )
+        raise _invalid_webhook_payload(str(exc)) from exc
+
+    # Persisting the event and publishing notifications block on MySQL and SQS,
+    # so they run in the threadpool instead of on the event loop.
+    return await run_in_threadpool(
+        _process_webhook_event,
+        session,
+        payload,
+        raw_body=raw_body,
+        headers=headers,
+        signature=signature or "",
+        metadata=metadata,
+        dispatcher=dispatcher,
+        settings=settings,
+    )
 
 
 # Register the webhook handler under the legacy orders-prefixed path so existing
@@ -418,14 +453,12 @@ router.add_api_route(
     tags=["payments"],
 )
 
-router.include_router(payments_router)
-
 
 @payments_router.post("/refund", response_model=RefundResponse)
 def request_refund(
     payload: RefundRequest,
     _: None = Depends(require_admin),
-    request: RequestMetadata = Depends(request_metadata),
+    request: dict[str, str] = Depends(request_metadata_dict),
     session: Session = Depends(db_session),
     razorpay=Depends(razorpay_service),
 ) -> Any:
@@ -461,11 +494,13 @@ def request_refund(
             payment.order.payment_status = "refunded"
             payment.order.status = "refunded"
     session.flush()
-    return RefundResponse(
-        payment_id=payment.payment_id,
-        refund_id=refund.refund_id,
-        status=refund.status,
-        request=request,
+    return ORJSONResponse(
+        {
+            "payment_id": payment.payment_id,
+            "refund_id": refund.refund_id,
+            "status": refund.status,
+            "request": request,
+        }
     )
 
 
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import uuid
 from typing import Dict
 
 from fastapi import HTTPException
 
-from ...core.logging import get_request_context
+from ...core.logging import get_request_context, new_request_id
 from ...schemas.common import ErrorResponse
 
 
@@ -17,7 +16,7 @@ def not_implemented(endpoint: str) -> HTTPException:
     error = ErrorResponse(
         code="not_implemented",
         message=f"{endpoint} contract not implemented yet",
-        details={"request_id": str(uuid.uuid4())},
+        details={"request_id": new_request_id()},
     )
     return HTTPException(status_code=501, detail=error.dict())
 
@@ -26,4 +25,4 @@ def build_request_metadata(request_id: str | None = None) -> Dict[str, str]:
     """Generate request metadata payload."""
     if request_id is None:
         request_id = get_request_context().get("request_id")
-    return {"request_id": request_id or str(uuid.uuid4())}
+    return {"request_id": request_id or new_request_id()}
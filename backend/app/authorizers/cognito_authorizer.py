@@ -3,50 +3,78 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Mapping
 
 try:
-    from core.config import get_settings
+    from core.config import SettingsScopedCache, get_settings
     from services.auth import (
         CognitoJWTVerifier,
         JWTVerificationError,
+        VerifiedTokenCache,
         principal_from_claims,
     )
 except ImportError:  # pragma: no cover - fallback for local package layout
-    from ..core.config import get_settings
+    from ..core.config import SettingsScopedCache, get_settings
     from ..services.auth import (
         CognitoJWTVerifier,
         JWTVerificationError,
+        VerifiedTokenCache,
         principal_from_claims,
     )
 
 logger = logging.getLogger(__name__)
 
 
+def _build_verifier(settings) -> tuple[CognitoJWTVerifier, VerifiedTokenCache]:
+    token_cache = VerifiedTokenCache(
+        maxsize=settings.jwt_cache_size,
+        ttl_seconds=settings.jwt_cache_ttl_seconds,
+    )
+    return CognitoJWTVerifier(settings), token_cache
+
+
+# Warm invocations reuse the verifier and token cache so the JWKS keys and
+# recently verified tokens survive between calls.
+_VERIFIERS = SettingsScopedCache(_build_verifier)
+
+
+def _get_verifier(settings) -> tuple[CognitoJWTVerifier, VerifiedTokenCache]:
+    return _VERIFIERS.get(settings)
+
+
 def _extract_bearer(headers: Mapping[str, Any] | None) -> str | None:
     if not headers:
         return None
-    header = headers.get("Authorization") or headers.get("authorization")
+    # API Gateway payload v2 and HTTP/2 clients send lowercase header names.
+    header = headers.get("authorization") or headers.get("Authorization")
     if not header:
         return None
-    if header.startswith("Bearer "):
-        return header.split(" ", 1)[1].strip()
+    if header[:7].lower() == "bearer ":
+        return header[7:].strip()
     return header.strip()
 
 
+@lru_cache(maxsize=256)
+def _policy_document(effect: str, resource: str) -> Dict[str, Any]:
+    # methodArn takes one value per route, so documents are shared across
+    # invocations; the Lambda runtime only serialises them, never mutates.
+    return {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Action": "execute-api:Invoke",
+                "Effect": effect,
+                "Resource": resource,
+            }
+        ],
+    }
+
+
 def _allow(principal_id: str, resource: str, context: Dict[str, str]) -> Dict[str, Any]:
     return {
         "principalId": principal_id,
-        "policyDocument": {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Action": "execute-api:Invoke",
-                    "Effect": "Allow",
-                    "Resource": resource,
-                }
-            ],
-        },
+        "policyDocument": _policy_document("Allow", resource),
         "context": context,
     }
 
@@ -54,16 +82,7 @@ def _allow(principal_id: str, resource: str, context: Dict[str, str]) -> Dict[st
 def _deny(principal_id: str, resource: str) -> Dict[str, Any]:
     return {
         "principalId": principal_id,
-        "policyDocument": {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Action": "execute-api:Invoke",
-                    "Effect": "Deny",
-                    "Resource": resource,
-                }
-            ],
-        },
+        "policyDocument": _policy_document("Deny", resource),
     }
 
 
@@ -83,9 +102,9 @@ def handle(event: Dict[str, Any], _context: Any | None = None) -> Dict[str, Any]
             context={"is_authenticated": "false"},
         )
 
-    verifier = CognitoJWTVerifier(settings)
+    verifier, token_cache = _get_verifier(settings)
     try:
-        claims = verifier.verify(token)
+        claims = token_cache.verify(token, verifier)
     except JWTVerificationError as exc:
         logger.warning("JWT verification failed", extra={"reason": str(exc)})
         return _deny("unauthorized", method_arn)
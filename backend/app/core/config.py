@@ -5,8 +5,9 @@ from __future__ import annotations
 import json
 import logging
 import os
-from functools import lru_cache
-from typing import ClassVar, Optional
+import threading
+from functools import cached_property, lru_cache
+from typing import Any, Callable, ClassVar, Generic, Mapping, Optional, TypeVar
 from urllib.parse import quote_plus
 
 from pydantic import Field
@@ -62,6 +63,8 @@ class Settings(BaseSettings):
     cognito_test_shared_secret: Optional[str] = Field(
         None, alias="COGNITO_TEST_SHARED_SECRET"
     )
+    jwt_cache_size: int = Field(10000, alias="JWT_CACHE_SIZE")
+    jwt_cache_ttl_seconds: float = Field(30.0, alias="JWT_CACHE_TTL_SECONDS")
     whatsapp_phone_number_id: Optional[str] = Field(
         None, alias="WHATSAPP_PHONE_NUMBER_ID"
     )
@@ -76,47 +79,170 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
     )
 
+    @cached_property
+    def cognito_admin_group_lower(self) -> str:
+        """Admin group name normalised once for case-insensitive checks."""
+
+        return self.cognito_admin_group.lower() if self.cognito_admin_group else ""
+
 
 @lru_cache()
 def get_settings() -> Settings:
     """Return a cached instance of the application settings."""
     settings = Settings()  # type: ignore[call-arg]
+    secrets = _fetch_secret_strings(settings, _startup_secret_ids(settings))
     if not settings.database_url:
-        derived_url = _build_database_url(settings)
+        derived_url = _build_database_url(settings, secrets)
         if derived_url:
             # Persist the derived URL so downstream helpers reuse the same value.
             settings.database_url = derived_url
             os.environ.setdefault("DATABASE_URL", derived_url)
-    _hydrate_razorpay_credentials(settings)
+    _hydrate_razorpay_credentials(settings, secrets)
     return settings
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-def _build_database_url(settings: Settings) -> Optional[str]:
-    """Derive a SQLAlchemy URL from Secrets Manager metadata when not provided."""
 
-    if not settings.db_secret_arn or not settings.db_host:
-        return None
+class SettingsScopedCache(Generic[T]):
+    """Hold one value built from a ``Settings`` instance until the instance changes.
+
+    ``get_settings`` returns the same object until its cache is cleared, so an
+    identity check is enough to tell when the value must be rebuilt. Pass
+    ``key`` to rebuild only when that derived value changes instead. The value
+    is built under a lock so concurrent cold-start requests build it once; a
+    factory that raises leaves nothing cached.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Settings], T],
+        *,
+        key: Callable[[Settings], Any] | None = None,
+    ) -> None:
+        self._factory = factory
+        self._key = key
+        self._lock = threading.Lock()
+        self._entry: tuple[Any, T] | None = None
+
+    def _matches(self, entry: tuple[Any, T] | None, cache_key: Any) -> bool:
+        if entry is None:
+            return False
+        if self._key is None:
+            return entry[0] is cache_key
+        return entry[0] == cache_key
+
+    def get(self, settings: Settings) -> T:
+        cache_key = settings if self._key is None else self._key(settings)
+        entry = self._entry
+        if self._matches(entry, cache_key):
+            return entry[1]  # type: ignore[index]
+        with self._lock:
+            entry = self._entry
+            if self._matches(entry, cache_key):
+                return entry[1]  # type: ignore[index]
+            value = self._factory(settings)
+            self._entry = (cache_key, value)
+            return value
+
+
+def _startup_secret_ids(settings: Settings) -> list[str]:
+    """Return the secrets ``get_settings`` still needs to resolve."""
+
+    secret_ids: list[str] = []
+    if not settings.database_url and settings.db_secret_arn and settings.db_host:
+        secret_ids.append(settings.db_secret_arn)
+    if settings.razorpay_secret_arn and not (
+        settings.razorpay_key_id and settings.razorpay_key_secret
+    ):
+        secret_ids.append(settings.razorpay_secret_arn)
+    return secret_ids
+
+
+@lru_cache(maxsize=1)
+def _secrets_client(region: str):
+    # Deferred import keeps local test environments lightweight.
+    import boto3  # type: ignore
+
+    return boto3.client("secretsmanager", region_name=region)
+
+
+def _matches_secret_id(secret_id: str, entry: Mapping[str, Any]) -> bool:
+    """Return whether a ``batch_get_secret_value`` entry answers ``secret_id``.
+
+    alembic/env.py applies the same rule to its own batch fetch.
+    """
+
+    arn = entry.get("ARN") or ""
+    # Requested ids may be a full ARN, a partial ARN, or a name.
+    return secret_id in (arn, entry.get("Name")) or arn.startswith(f"{secret_id}-")
 
-    try:  # Deferred import keeps local test environments lightweight.
-        import boto3  # type: ignore
-    except ImportError as exc:  # pragma: no cover - boto3 always available in Lambda
-        raise RuntimeError("boto3 is required to resolve database credentials") from exc
 
-    client = boto3.client("secretsmanager", region_name=settings.region)
+def _fetch_secret_strings(settings: Settings, secret_ids: list[str]) -> dict[str, str]:
+    """Fetch ``SecretString`` values in one round trip, keyed by requested id.
+
+    Secrets that could not be read are left out of the result so each caller
+    can decide whether that is fatal.
+    """
+
+    if not secret_ids:
+        return {}
+
+    try:
+        client = _secrets_client(settings.region)
+    except ImportError:  # pragma: no cover - boto3 always available in Lambda
+        logger.warning("boto3 unavailable; unable to load secrets from Secrets Manager")
+        return {}
+
+    secrets: dict[str, str] = {}
     try:
-        response = client.get_secret_value(SecretId=settings.db_secret_arn)
-    except Exception as exc:  # pragma: no cover - network dependent
-        logger.error(
-            "Failed to fetch database credentials from Secrets Manager",
-            extra={"secret_arn": settings.db_secret_arn},
+        response = client.batch_get_secret_value(SecretIdList=secret_ids)
+    except Exception as exc:  # pragma: no cover - network / IAM dependent
+        # Roles granted only secretsmanager:GetSecretValue cannot batch.
+        logger.info(
+            "Batch secret fetch failed; falling back to individual requests",
             exc_info=exc,
         )
-        raise RuntimeError("Unable to resolve database credentials") from exc
+    else:
+        for entry in response.get("SecretValues", []):
+            for secret_id in secret_ids:
+                if _matches_secret_id(secret_id, entry):
+                    secrets[secret_id] = entry.get("SecretString") or ""
+        for error in response.get("Errors", []):
+            logger.error(
+                "Failed to fetch secret from Secrets Manager",
+                extra={
+                    "secret_arn": error.get("SecretId"),
+                    "error_code": error.get("ErrorCode"),
+                },
+            )
+        return secrets
+
+    for secret_id in secret_ids:  # pragma: no cover - network dependent
+        try:
+            response = client.get_secret_value(SecretId=secret_id)
+        except Exception as exc:
+            logger.error(
+                "Failed to fetch secret from Secrets Manager",
+                extra={"secret_arn": secret_id},
+                exc_info=exc,
+            )
+            continue
+        secrets[secret_id] = response.get("SecretString") or ""
+    return secrets
+
+
+def _build_database_url(settings: Settings, secrets: dict[str, str]) -> Optional[str]:
+    """Derive a SQLAlchemy URL from Secrets Manager metadata when not provided."""
+
+    if not settings.db_secret_arn or not settings.db_host:
+        return None
 
-    secret_string = response.get("SecretString")
+    secret_string = secrets.get(settings.db_secret_arn)
+    if secret_string is None:
+        raise RuntimeError("Unable to resolve database credentials")
     if not secret_string:
         raise RuntimeError("Database secret does not contain a SecretString value")
 
@@ -139,7 +265,7 @@ def _build_database_url(settings: Settings) -> Optional[str]:
     return f"mysql+pymysql://{user_enc}:{pass_enc}@{host}:{port}/{database}"
 
 
-def _hydrate_razorpay_credentials(settings: Settings) -> None:
+def _hydrate_razorpay_credentials(settings: Settings, secrets: dict[str, str]) -> None:
     """Populate Razorpay credentials from Secrets Manager when necessary."""
 
     if settings.razorpay_key_id and settings.razorpay_key_secret:
@@ -148,26 +274,9 @@ def _hydrate_razorpay_credentials(settings: Settings) -> None:
     if not secret_arn:
         return
 
-    try:  # pragma: no cover - boto3 available in Lambda
-        import boto3  # type: ignore
-    except ImportError:  # pragma: no cover - local dev without boto3
-        logger.warning(
-            "boto3 unavailable; unable to load Razorpay credentials from Secrets Manager"
-        )
+    secret_string = secrets.get(secret_arn)
+    if secret_string is None:
         return
-
-    client = boto3.client("secretsmanager", region_name=settings.region)
-    try:
-        response = client.get_secret_value(SecretId=secret_arn)
-    except Exception as exc:  # pragma: no cover - AWS network failures
-        logger.error(
-            "Failed to fetch Razorpay credentials from Secrets Manager",
-            extra={"secret_arn": secret_arn},
-            exc_info=exc,
-        )
-        return
-
-    secret_string = response.get("SecretString")
     if not secret_string:
         logger.warning(
             "Razorpay secret does not contain a SecretString value",
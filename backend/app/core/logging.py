@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import re
 from contextvars import ContextVar, Token
 from datetime import datetime, timezone
 from typing import Any, Iterable, Mapping
@@ -43,15 +45,30 @@ _SENSITIVE_KEY_FRAGMENTS: tuple[str, ...] = (
     "credential",
 )
 
+_SENSITIVE_KEY_RE = re.compile("|".join(map(re.escape, _SENSITIVE_KEY_FRAGMENTS)))
+
+_NESTED_TYPES = (Mapping, list, tuple, set, frozenset)
+
 _REDACTED = "***redacted***"
 
 
 def _sanitize_value(value: Any) -> Any:
-    """Recursively sanitize sensitive structures."""
+    """Recursively sanitize sensitive structures.
+
+    Plain dicts and sequences with nothing to redact are returned as-is
+    rather than rebuilt.
+    """
 
     if isinstance(value, Mapping):
+        if type(value) is dict and not any(
+            _SENSITIVE_KEY_RE.search(k.lower()) or isinstance(v, _NESTED_TYPES)
+            for k, v in value.items()
+        ):
+            return value
         return {k: _sanitize_item(k, v) for k, v in value.items()}
     if isinstance(value, (list, tuple, set, frozenset)):
+        if not any(isinstance(item, _NESTED_TYPES) for item in value):
+            return value
         sanitized: Iterable[Any] = (_sanitize_value(item) for item in value)
         return type(value)(sanitized)  # type: ignore[call-arg]
     return value
@@ -60,8 +77,7 @@ def _sanitize_value(value: Any) -> Any:
 def _sanitize_item(key: str, value: Any) -> Any:
     """Redact values whose keys indicate sensitive data."""
 
-    lowered = key.lower()
-    if any(fragment in lowered for fragment in _SENSITIVE_KEY_FRAGMENTS):
+    if _SENSITIVE_KEY_RE.search(key.lower()):
         return _REDACTED
     return _sanitize_value(value)
 
@@ -133,6 +149,20 @@ def configure_logging(level: str = "INFO") -> None:
     logging.captureWarnings(True)
 
 
+def new_request_id() -> str:
+    """Return a random RFC 4122 version 4 id formatted like ``str(uuid4())``.
+
+    Formats ``os.urandom`` output directly instead of building a ``uuid.UUID``
+    object, since request ids are generated on every request.
+    """
+
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    value = raw.hex()
+    return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+
+
 def set_request_context(context: Mapping[str, Any]) -> Token:
     """Bind request context values for downstream log records."""
 
@@ -2,27 +2,17 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from functools import lru_cache
-from typing import Mapping, Sequence
-
-try:  # pragma: no cover - optional for local testing
-    import boto3  # type: ignore
-except ImportError:  # pragma: no cover - boto3 missing locally
-    boto3 = None  # type: ignore
+import sys
+import time
+from typing import Mapping
 
 logger = logging.getLogger(__name__)
 
 _METRICS_NAMESPACE = "AleenasCuisine/Application"
 
 
-@lru_cache(maxsize=1)
-def _cloudwatch_client():
-    if boto3 is None:
-        raise RuntimeError("boto3 is required to publish metrics")
-    return boto3.client("cloudwatch")
-
-
 def emit_metric(
     name: str,
     value: float = 1.0,
@@ -30,37 +20,40 @@ def emit_metric(
     *,
     dimensions: Mapping[str, str] | None = None,
 ) -> None:
-    """Publish a single data point to CloudWatch, swallowing runtime errors."""
+    """Publish a single data point to CloudWatch, swallowing runtime errors.
 
-    try:
-        client = _cloudwatch_client()
-    except RuntimeError:
-        logger.debug(
-            "CloudWatch client unavailable; metric dropped", extra={"metric": name}
-        )
-        return
+    The data point is written to stdout in the CloudWatch Embedded Metric
+    Format; CloudWatch Logs extracts it from the function's log stream, so no
+    API call is made on the request path.
+    """
 
-    metric_dimensions: Sequence[dict[str, str]] = []
+    metric_dimensions: dict[str, str] = {}
     if dimensions:
-        metric_dimensions = [
-            {"Name": key, "Value": str(value)}
-            for key, value in dimensions.items()
-            if value is not None
-        ]
-
-    try:
-        client.put_metric_data(
-            Namespace=_METRICS_NAMESPACE,
-            MetricData=[
+        metric_dimensions = {
+            key: str(dimension_value)
+            for key, dimension_value in dimensions.items()
+            if dimension_value is not None
+        }
+
+    record = {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
                 {
-                    "MetricName": name,
-                    "Value": value,
-                    "Unit": unit,
-                    "Dimensions": list(metric_dimensions),
+                    "Namespace": _METRICS_NAMESPACE,
+                    "Dimensions": [list(metric_dimensions)],
+                    "Metrics": [{"Name": name, "Unit": unit}],
                 }
             ],
-        )
-    except Exception as exc:  # pragma: no cover - network errors
+        },
+        **metric_dimensions,
+        name: value,
+    }
+
+    try:
+        sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+        sys.stdout.flush()
+    except Exception as exc:  # pragma: no cover - closed or unserialisable stream
         logger.warning(
             "Failed to publish CloudWatch metric",
             extra={"metric": name, "error": str(exc)},
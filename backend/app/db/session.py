@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import threading
+from contextlib import contextmanager
 from typing import Iterator, Optional
 
 from sqlalchemy import create_engine
@@ -65,8 +66,9 @@ def _initialize_schema(engine: Engine) -> None:
     _schema_initialized = True
 
 
-def get_db_session(database_url: Optional[str] = None) -> Iterator[Session]:
-    """Yield a transactional SQLAlchemy session."""
+@contextmanager
+def session_scope(database_url: Optional[str] = None) -> Iterator[Session]:
+    """Provide a session that commits on success and rolls back on error."""
 
     get_engine(database_url)
     session: Session = _SessionFactory()
@@ -80,6 +82,13 @@ def get_db_session(database_url: Optional[str] = None) -> Iterator[Session]:
         session.close()
 
 
+def get_db_session(database_url: Optional[str] = None) -> Iterator[Session]:
+    """Yield a transactional SQLAlchemy session."""
+
+    with session_scope(database_url) as session:
+        yield session
+
+
 def reset_engine() -> None:
     """Reset the engine/session state (primarily for testing)."""
 
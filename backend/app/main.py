@@ -4,9 +4,6 @@ from __future__ import annotations
 
 import logging
 import time
-import uuid
-from contextlib import contextmanager
-from typing import Iterator
 
 from fastapi import FastAPI, Request
 from fastapi.responses import Response
@@ -17,12 +14,13 @@ from .core.config import get_settings
 from .core.logging import (
     configure_logging,
     get_request_context,
+    new_request_id,
     reset_request_context,
     set_request_context,
     update_request_context,
 )
 from .core.tracing import init_tracing
-from .db.session import configure_engine, get_db_session
+from .db.session import configure_engine, session_scope
 from .services.catalog_seed import seed_curated_catalog
 
 settings = get_settings()
@@ -34,24 +32,11 @@ app = FastAPI(title="Aleena's Cuisine API")
 app.include_router(api_router, prefix=settings.api_prefix)
 
 
-@contextmanager
-def _session_scope(database_url: str) -> Iterator:
-    session_iter = get_db_session(database_url)
-    session = next(session_iter)
-    try:
-        yield session
-    finally:
-        try:
-            next(session_iter)
-        except StopIteration:
-            pass
-
-
 @app.on_event("startup")
 def seed_catalog() -> None:
     database_url = settings.database_url or "sqlite:///./aleena_dev.db"
     configure_engine(database_url)
-    with _session_scope(database_url) as session:
+    with session_scope(database_url) as session:
         inserted, updated = seed_curated_catalog(session)
         if inserted or updated:
             logging.getLogger("app.seed").info(
@@ -64,7 +49,7 @@ def seed_catalog() -> None:
 async def structured_logging_middleware(request: Request, call_next):
     """Attach request context and emit structured request logs."""
 
-    request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
+    request_id = request.headers.get("x-request-id") or new_request_id()
     start = time.perf_counter()
     path = request.url.path
     order_id = request.path_params.get("order_id")
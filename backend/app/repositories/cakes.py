@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Tuple
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Result, Select, func, or_, select
 from sqlalchemy.orm import Session
 
 from ..db.models import Cake
@@ -32,8 +32,20 @@ def _get_by_slug(session: Session, slug: str) -> Cake | None:
     return session.execute(stmt).scalar_one_or_none()
 
 
-def list_cakes(
+_SUMMARY_COLUMNS = (
+    Cake.cake_id,
+    Cake.name,
+    Cake.slug,
+    Cake.price,
+    Cake.currency,
+    Cake.category,
+    Cake.is_available,
+)
+
+
+def _paginate_catalog(
     session: Session,
+    base_query: Select,
     *,
     search: str | None,
     category: str | None,
@@ -41,9 +53,7 @@ def list_cakes(
     max_price: float | None,
     page: int,
     page_size: int,
-) -> Tuple[list[Cake], int]:
-    base_query = select(Cake)
-
+) -> Tuple[Result, int]:
     if search:
         pattern = f"%{search.lower()}%"
         base_query = base_query.where(
@@ -68,8 +78,67 @@ def list_cakes(
         .offset((page - 1) * page_size)
         .limit(page_size)
     )
-    cakes = session.execute(stmt).scalars().all()
-    return cakes, int(total)
+    return session.execute(stmt), int(total)
+
+
+def list_cakes(
+    session: Session,
+    *,
+    search: str | None,
+    category: str | None,
+    min_price: float | None,
+    max_price: float | None,
+    page: int,
+    page_size: int,
+) -> Tuple[list[Cake], int]:
+    result, total = _paginate_catalog(
+        session,
+        select(Cake),
+        search=search,
+        category=category,
+        min_price=min_price,
+        max_price=max_price,
+        page=page,
+        page_size=page_size,
+    )
+    return result.scalars().all(), total
+
+
+def list_cake_summaries(
+    session: Session,
+    *,
+    search: str | None,
+    category: str | None,
+    min_price: float | None,
+    max_price: float | None,
+    page: int,
+    page_size: int,
+) -> Tuple[list[dict[str, object]], int]:
+    """Return summary dicts selected as plain columns, skipping ORM hydration."""
+
+    result, total = _paginate_catalog(
+        session,
+        select(*_SUMMARY_COLUMNS),
+        search=search,
+        category=category,
+        min_price=min_price,
+        max_price=max_price,
+        page=page,
+        page_size=page_size,
+    )
+    summaries = [
+        {
+            "cake_id": row.cake_id,
+            "name": row.name,
+            "slug": row.slug,
+            "price": float(row.price),
+            "currency": row.currency,
+            "category": row.category,
+            "is_available": row.is_available,
+        }
+        for row in result
+    ]
+    return summaries, total
 
 
 def get_cake(session: Session, cake_id: str) -> Cake:
@@ -26,7 +26,7 @@ class CartPriceMismatchError(Exception):
     """Raised when the cart contains items priced differently from the catalog."""
 
     def __init__(self, mismatches: Sequence[Tuple[str, float, float]]):
-        self.mismatches = list(mismatches)
+        self.mismatches = mismatches
         super().__init__("Cart contains items priced differently from the catalog")
 
 
@@ -125,8 +125,15 @@ def upsert_cart(
 
     cart.updated_at = _now()
     session.flush()
-    session.refresh(cart)
-    return cart
+    # Reload the cart, items and cakes in one joined query rather than a plain
+    # refresh followed by a lazy load per item during serialization.
+    stmt = (
+        select(Cart)
+        .options(joinedload(Cart.items).joinedload(CartItem.cake))
+        .where(Cart.cart_id == cart.cart_id)
+        .execution_options(populate_existing=True)
+    )
+    return session.execute(stmt).unique().scalar_one()
 
 
 def get_cart_by_reference(session: Session, reference: str) -> Cart:
@@ -136,6 +136,19 @@ _CANCELLATION_WINDOW = timedelta(hours=24)
 
 def expire_stale_reservations(session: Session, now: datetime | None = None) -> int:
     current_time = now or _now()
+    # Released holds clear reservation_expires_at, so a single probe on
+    # ix_orders_reservation_expires_at answers the common nothing-to-do case.
+    probe = (
+        select(Order.reservation_expires_at)
+        .where(
+            Order.reservation_expires_at.is_not(None),
+            Order.reservation_expires_at < current_time,
+        )
+        .limit(1)
+    )
+    if session.execute(probe).first() is None:
+        return 0
+
     stmt = (
         select(Order)
         .options(joinedload(Order.items))
@@ -499,12 +512,14 @@ def record_webhook(
     session: Session,
     *,
     headers: dict[str, str],
-    payload: dict[str, object],
+    raw_payload: bytes,
     signature: str,
 ) -> RazorpayEvent:
+    # Store the body exactly as Razorpay signed it instead of re-encoding the
+    # parsed payload; the caller has already validated it as UTF-8 JSON.
     event = RazorpayEvent(
         headers_json=json.dumps(headers, default=str),
-        payload_json=json.dumps(payload, default=str),
+        payload_json=raw_payload.decode("utf-8"),
         signature=signature,
     )
     session.add(event)
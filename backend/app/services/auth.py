@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import base64
 import datetime as dt
+import hashlib
 import json
 import threading
 import time
 import urllib.request
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, Mapping, Optional
 
@@ -84,6 +86,46 @@ class CognitoJWKSCache:
         raise JWTVerificationError("Matching JWK not found for token")
 
 
+class VerifiedTokenCache:
+    """Bounded LRU cache of claims for tokens that already passed verification."""
+
+    def __init__(self, maxsize: int = 10000, ttl_seconds: float = 30.0) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, tuple[float, Mapping[str, Any]]] = (
+            OrderedDict()
+        )
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+
+    def verify(self, token: str, verifier: CognitoJWTVerifier) -> Mapping[str, Any]:
+        """Return cached claims for ``token`` or verify it and cache the result."""
+
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now < entry[0]:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+
+        claims = verifier.verify(token)
+        if self._maxsize <= 0 or self._ttl_seconds <= 0:
+            return claims
+        expires_at = now + self._ttl_seconds
+        exp = claims.get("exp")
+        if exp is not None:
+            # Never serve claims past the token's own expiry.
+            expires_at = min(expires_at, float(exp))
+        with self._lock:
+            self._entries[key] = (expires_at, claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return claims
+
+
 class CognitoJWTVerifier:
     """Verify Cognito-issued JWTs with optional local test mode."""
 
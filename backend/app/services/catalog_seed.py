@@ -23,10 +23,15 @@ def seed_curated_catalog(session: Session) -> Tuple[int, int]:
     inserted = 0
     updated = 0
 
+    slugs = [curated.slug for curated in CURATED_CAKES]
+    existing_by_slug = {
+        cake.slug: cake
+        for cake in session.execute(select(Cake).where(Cake.slug.in_(slugs))).scalars()
+    }
+    new_cakes: list[Cake] = []
+
     for curated in CURATED_CAKES:
-        existing = session.execute(
-            select(Cake).where(Cake.slug == curated.slug)
-        ).scalar_one_or_none()
+        existing = existing_by_slug.get(curated.slug)
 
         if existing:
             has_changes = False
@@ -58,7 +63,7 @@ def seed_curated_catalog(session: Session) -> Tuple[int, int]:
             if has_changes:
                 updated += 1
         else:
-            session.add(
+            new_cakes.append(
                 Cake(
                     cake_id=curated.cake_id,
                     name=curated.name,
@@ -74,6 +79,9 @@ def seed_curated_catalog(session: Session) -> Tuple[int, int]:
             )
             inserted += 1
 
+    if new_cakes:
+        session.add_all(new_cakes)
+
     if inserted or updated:
         session.flush()
         logger.info(
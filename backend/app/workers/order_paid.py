@@ -4,12 +4,11 @@ from __future__ import annotations
 
 import json
 import logging
-from contextlib import contextmanager
 from typing import Any, Dict, Iterable
 
 from ..core.config import get_settings
 from ..core.tracing import add_tracing_metadata, init_tracing, xray_subsegment
-from ..db.session import get_db_session
+from ..db.session import session_scope
 from ..repositories import orders as order_repo
 from ..repositories import invoices as invoice_repo
 from ..services.invoices import InvoiceGenerationError, InvoiceService
@@ -29,19 +28,6 @@ def _parse_message(body: str) -> Dict[str, Any]:
     return message
 
 
-@contextmanager
-def _session_scope(database_url: str):
-    iterator = get_db_session(database_url)
-    session = next(iterator)
-    try:
-        yield session
-    finally:
-        try:
-            next(iterator)
-        except StopIteration:
-            pass
-
-
 def _process_order_paid(
     message: Dict[str, Any],
     invoice_service: InvoiceService,
@@ -56,7 +42,7 @@ def _process_order_paid(
         )
         return
     add_tracing_metadata(order_id=order_id)
-    with _session_scope(database_url) as session:
+    with session_scope(database_url) as session:
         with xray_subsegment("db.get_order", order_id=order_id):
             order = order_repo.get_order(session, order_id)
         try:
@@ -107,7 +93,7 @@ def _process_status_update(
         )
         return
     add_tracing_metadata(order_id=order_id, event_type=event_type)
-    with _session_scope(database_url) as session:
+    with session_scope(database_url) as session:
         with xray_subsegment("db.get_order", order_id=order_id):
             order = order_repo.get_order(session, order_id)
         if event_type == "order.refunded":
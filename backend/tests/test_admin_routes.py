@@ -130,3 +130,27 @@ def test_missing_admin_token_returns_unauthorized(client: TestClient) -> None:
     resp = client.post("/api/v1/admin/cakes", json=payload)
     assert resp.status_code == 401
     assert resp.json()["detail"]["code"] == "unauthorized"
+
+
+def test_bearer_scheme_is_case_insensitive(
+    client: TestClient, admin_headers: dict[str, str]
+) -> None:
+    token = admin_headers["Authorization"].split(" ", 1)[1]
+    for scheme in ("bearer", "BEARER"):
+        payload = {
+            "name": "Lemon Tart",
+            "slug": f"lemon-tart-{scheme}",
+            "description": None,
+            "price": 899.0,
+            "currency": "INR",
+            "category": None,
+            "is_available": True,
+            "stock_quantity": 2,
+            "image_url": None,
+        }
+        resp = client.post(
+            "/api/v1/admin/cakes",
+            json=payload,
+            headers={"Authorization": f"{scheme} {token}"},
+        )
+        assert resp.status_code == 200
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+import pytest  # type: ignore[import-not-found]
+
+from app.authorizers import cognito_authorizer
+from app.services import auth as auth_service
+from app.services.auth import (
+    CognitoJWTVerifier,
+    VerifiedTokenCache,
+)
+
+from tests.conftest import _issue_test_token
+
+
+class CountingVerifier:
+    def __init__(self, exp: float | None = None) -> None:
+        self.calls: list[str] = []
+        self._exp = exp
+
+    def verify(self, token: str) -> Mapping[str, Any]:
+        self.calls.append(token)
+        claims: dict[str, Any] = {"sub": token}
+        if self._exp is not None:
+            claims["exp"] = self._exp
+        return claims
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock(1_000_000.0)
+    monkeypatch.setattr(auth_service.time, "time", fake.time)
+    return fake
+
+
+def test_repeat_token_is_served_from_cache(clock: FakeClock) -> None:
+    cache = VerifiedTokenCache(maxsize=10, ttl_seconds=30)
+    verifier = CountingVerifier()
+
+    first = cache.verify("token-a", verifier)  # type: ignore[arg-type]
+    second = cache.verify("token-a", verifier)  # type: ignore[arg-type]
+
+    assert first is second
+    assert verifier.calls == ["token-a"]
+
+
+def test_configured_ttl_bounds_entries(clock: FakeClock) -> None:
+    cache = VerifiedTokenCache(maxsize=10, ttl_seconds=30)
+    verifier = CountingVerifier(exp=clock.now + 3600)
+
+    cache.verify("token-a", verifier)  # type: ignore[arg-type]
+    clock.now += 29
+    cache.verify("token-a", verifier)  # type: ignore[arg-type]
+    assert len(verifier.calls) == 1
+
+    clock.now += 1
+    cache.verify("token-a", verifier)  # type: ignore[arg-type]
+    assert len(verifier.calls) == 2
+
+
+def test_entries_never_outlive_token_exp(clock: FakeClock) -> None:
+    cache = VerifiedTokenCache(maxsize=10, ttl_seconds=30)
+    verifier = CountingVerifier(exp=clock.now + 5)
+
+    cache.verify("token-a", verifier)  # type: ignore[arg-type]
+    clock.now += 4
+    cache.verify("token-a", verifier)  # type: ignore[arg-type]
+    assert len(verifier.calls) == 1
+
+    clock.now += 1
+    cache.verify("token-a", verifier)  # type: ignore[arg-type]
+    assert len(verifier.calls) == 2
+
+
+def test_least_recently_used_entry_is_evicted(clock: FakeClock) -> None:
+    cache = VerifiedTokenCache(maxsize=2, ttl_seconds=30)
+    verifier = CountingVerifier()
+
+    cache.verify("token-a", verifier)  # type: ignore[arg-type]
+    cache.verify("token-b", verifier)  # type: ignore[arg-type]
+    cache.verify("token-a", verifier)  # type: ignore[arg-type]
+    cache.verify("token-c", verifier)  # type: ignore[arg-type]
+    assert verifier.calls == ["token-a", "token-b", "token-c"]
+
+    cache.verify("token-a", verifier)  # type: ignore[arg-type]
+    cache.verify("token-b", verifier)  # type: ignore[arg-type]
+    assert verifier.calls == ["token-a", "token-b", "token-c", "token-b"]
+
+
+@pytest.mark.parametrize("maxsize, ttl_seconds", [(0, 30), (-1, 30), (10, 0), (10, -1)])
+def test_non_positive_limits_disable_caching(
+    clock: FakeClock, maxsize: int, ttl_seconds: float
+) -> None:
+    cache = VerifiedTokenCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+    verifier = CountingVerifier()
+
+    cache.verify("token-a", verifier)  # type: ignore[arg-type]
+    cache.verify("token-a", verifier)  # type: ignore[arg-type]
+
+    assert verifier.calls == ["token-a", "token-a"]
+
+
+def test_failed_verification_is_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    original_verify = CognitoJWTVerifier.verify
+
+    def counting_verify(self: CognitoJWTVerifier, token: str) -> Mapping[str, Any]:
+        calls.append(token)
+        return original_verify(self, token)
+
+    monkeypatch.setattr(CognitoJWTVerifier, "verify", counting_verify)
+    token = _issue_test_token(subject="customer")
+    header, payload, signature = token.split(".")
+    tampered = f"{header}.{payload}.{signature[::-1]}"
+    event = {
+        "methodArn": "arn:aws:execute-api:ap-south-1:123:api/GET/orders",
+        "headers": {"Authorization": f"Bearer {tampered}"},
+    }
+
+    for _ in range(2):
+        response = cognito_authorizer.handle(event)
+        assert response["policyDocument"]["Statement"][0]["Effect"] == "Deny"
+    assert calls == [tampered, tampered]
+
+    event["headers"] = {"Authorization": f"Bearer {token}"}
+    for _ in range(2):
+        response = cognito_authorizer.handle(event)
+        assert response["policyDocument"]["Statement"][0]["Effect"] == "Allow"
+    assert calls == [tampered, tampered, token]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+
+import pytest  # type: ignore[import-not-found]
+
+from app.core.metrics import emit_metric
+
+
+def _emitted_record(capsys: pytest.CaptureFixture[str]) -> dict[str, object]:
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert len(lines) == 1
+    return json.loads(lines[0])
+
+
+def test_emit_metric_writes_embedded_metric_format(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    emit_metric(
+        "order_processing_time",
+        12.5,
+        unit="Milliseconds",
+        dimensions={"Environment": "dev", "reason": None},  # type: ignore[dict-item]
+    )
+
+    record = _emitted_record(capsys)
+    directive = record["_aws"]["CloudWatchMetrics"][0]  # type: ignore[index]
+    assert directive["Namespace"] == "AleenasCuisine/Application"
+    assert directive["Dimensions"] == [["Environment"]]
+    assert directive["Metrics"] == [
+        {"Name": "order_processing_time", "Unit": "Milliseconds"}
+    ]
+    assert isinstance(record["_aws"]["Timestamp"], int)  # type: ignore[index]
+    assert record["order_processing_time"] == 12.5
+    assert record["Environment"] == "dev"
+    assert "reason" not in record
+
+
+def test_emit_metric_without_dimensions_uses_empty_dimension_set(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    emit_metric("orders_created")
+
+    record = _emitted_record(capsys)
+    directive = record["_aws"]["CloudWatchMetrics"][0]  # type: ignore[index]
+    assert directive["Dimensions"] == [[]]
+    assert directive["Metrics"] == [{"Name": "orders_created", "Unit": "Count"}]
+    assert record["orders_created"] == 1.0
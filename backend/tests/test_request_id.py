@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import uuid
+
+from app.core.logging import new_request_id
+
+
+def test_new_request_id_is_rfc4122_version4_uuid() -> None:
+    request_ids = {new_request_id() for _ in range(200)}
+
+    assert len(request_ids) == 200
+    for request_id in request_ids:
+        parsed = uuid.UUID(request_id)
+        assert str(parsed) == request_id
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
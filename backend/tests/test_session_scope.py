@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import uuid
+from typing import Iterator
+
+import pytest  # type: ignore[import-not-found]
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient  # type: ignore[import-not-found]
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.deps import db_session
+from app.db.models import Cart
+from app.db.session import session_scope
+
+from tests.conftest import TEST_DB_URL
+
+
+@pytest.fixture
+def session_client() -> Iterator[TestClient]:
+    session_app = FastAPI()
+
+    @session_app.post("/carts/{customer_id}")
+    def create_cart(
+        customer_id: str, fail: bool = False, session: Session = Depends(db_session)
+    ) -> dict[str, str]:
+        session.add(Cart(customer_id=customer_id))
+        session.flush()
+        if fail:
+            raise HTTPException(status_code=409, detail={"code": "conflict"})
+        return {"customer_id": customer_id}
+
+    with TestClient(session_app) as test_client:
+        yield test_client
+
+
+def _persisted_carts(customer_id: str) -> list[Cart]:
+    with session_scope(TEST_DB_URL) as session:
+        return list(
+            session.scalars(select(Cart).where(Cart.customer_id == customer_id))
+        )
+
+
+def test_request_session_commits_on_success(session_client: TestClient) -> None:
+    customer_id = str(uuid.uuid4())
+
+    resp = session_client.post(f"/carts/{customer_id}")
+
+    assert resp.status_code == 200
+    assert len(_persisted_carts(customer_id)) == 1
+
+
+def test_request_session_rolls_back_when_handler_raises(
+    session_client: TestClient,
+) -> None:
+    customer_id = str(uuid.uuid4())
+
+    resp = session_client.post(f"/carts/{customer_id}", params={"fail": "true"})
+
+    assert resp.status_code == 409
+    assert _persisted_carts(customer_id) == []
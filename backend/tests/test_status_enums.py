@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import ast
+import importlib.util
+from pathlib import Path
+
+from app.repositories.orders import _ALLOWED_STATUS_TRANSITIONS
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+ENUM_MIGRATION = (
+    BACKEND_ROOT / "alembic" / "versions" / "202610140130_native_order_status_enums.py"
+)
+# Modules that write orders.status / orders.payment_status.
+ORDER_WRITERS = (
+    BACKEND_ROOT / "app" / "repositories" / "orders.py",
+    BACKEND_ROOT / "app" / "api" / "routes" / "orders.py",
+)
+
+
+def _load_enum_migration():
+    spec = importlib.util.spec_from_file_location("native_order_status_enums", ENUM_MIGRATION)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _string_literals(node: ast.AST, assigned: dict[str, list[ast.AST]]) -> set[str]:
+    """String constants an expression can evaluate to."""
+
+    if isinstance(node, ast.Constant):
+        return {node.value} if isinstance(node.value, str) else set()
+    if isinstance(node, ast.IfExp):
+        branches: list[ast.AST] = [node.body, node.orelse]
+    elif isinstance(node, ast.BoolOp):
+        branches = list(node.values)
+    elif isinstance(node, ast.Name):
+        # Resolve locals such as ``desired_payment_status`` one level deep.
+        branches = assigned.get(node.id, [])
+        assigned = {}
+    else:
+        return set()
+    literals: set[str] = set()
+    for branch in branches:
+        literals |= _string_literals(branch, assigned)
+    return literals
+
+
+def _is_order(node: ast.AST) -> bool:
+    # ``order.status`` or ``payment.order.status``; ``payment.status`` is VARCHAR.
+    if isinstance(node, ast.Name):
+        return node.id == "order"
+    return isinstance(node, ast.Attribute) and node.attr == "order"
+
+
+def _written_order_statuses() -> dict[str, set[str]]:
+    written: dict[str, set[str]] = {"status": set(), "payment_status": set()}
+    for path in ORDER_WRITERS:
+        tree = ast.parse(path.read_text())
+        assigned: dict[str, list[ast.AST]] = {}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        assigned.setdefault(target.id, []).append(node.value)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if (
+                        isinstance(target, ast.Attribute)
+                        and target.attr in written
+                        and _is_order(target.value)
+                    ):
+                        written[target.attr] |= _string_literals(node.value, assigned)
+            elif (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id == "Order"
+            ):
+                for keyword in node.keywords:
+                    if keyword.arg in written:
+                        written[keyword.arg] |= _string_literals(keyword.value, assigned)
+    return written
+
+
+def test_transition_statuses_are_in_order_status_enum() -> None:
+    migration = _load_enum_migration()
+    transition_statuses = set(_ALLOWED_STATUS_TRANSITIONS)
+    for targets in _ALLOWED_STATUS_TRANSITIONS.values():
+        transition_statuses |= targets
+
+    assert transition_statuses <= set(migration.ORDER_STATUSES)
+
+
+def test_written_statuses_are_in_order_enums() -> None:
+    migration = _load_enum_migration()
+    written = _written_order_statuses()
+
+    # Guard against the scan silently matching nothing.
+    assert {"pending", "confirmed", "expired", "refund_initiated"} <= written["status"]
+    assert {"pending", "paid", "authorized", "refund_requested"} <= written[
+        "payment_status"
+    ]
+    assert written["status"] <= set(migration.ORDER_STATUSES)
+    assert written["payment_status"] <= set(migration.ORDER_PAYMENT_STATUSES)